@@ -19,6 +19,10 @@ echo Building GPU-SIM.exe...
 echo.
 
 cd /d "%~dp0.."
+
+REM Compile Qt resources (stylesheets) into src/ui/resources_rc.py
+python -m PyQt5.pyrcc_main src/ui/resources/resources.qrc -o src/ui/resources_rc.py
+
 python -m PyInstaller build/gpu_sim.spec --clean --noconfirm
 
 echo.
@@ -32,6 +32,7 @@ class ConfigManager:
                          If None, uses the default location.
         """
         self._profiles: Dict[str, GPUProfile] = {}
+        self._profile_list: List[GPUProfile] = []
         self._active_profile: Optional[GPUProfile] = None
 
         # Determine profiles directory
@@ -125,10 +126,13 @@ class ConfigManager:
         Returns:
             Number of profiles loaded.
         """
-        self._profiles.clear()
+        # Build into a new dict and swap it in at the end, so readers on
+        # another thread never see a half-loaded set (see MainWindow refresh)
+        profiles: Dict[str, GPUProfile] = {}
 
         if not self._profiles_dir.exists():
             logger.warning(f"Profiles directory does not exist: {self._profiles_dir}")
+            self._publish_profiles(profiles)
             return 0
 
         loaded = 0
@@ -136,15 +140,27 @@ class ConfigManager:
             try:
                 profile = self._load_profile_file(file_path)
                 if profile:
-                    self._profiles[profile.id] = profile
+                    profiles[profile.id] = profile
                     loaded += 1
                     logger.debug(f"Loaded profile: {profile.name}")
             except Exception as e:
                 logger.error(f"Failed to load profile from {file_path}: {e}")
 
+        self._publish_profiles(profiles)
+
         logger.info(f"Loaded {loaded} GPU profiles")
         return loaded
 
+    def _publish_profiles(self, profiles: Dict[str, GPUProfile]) -> None:
+        """
+        Swap in a new profile dict together with its eagerly built list.
+
+        The list is assigned first so list_profiles never returns profiles
+        missing from the dict; neither object is mutated once published.
+        """
+        self._profile_list = list(profiles.values())
+        self._profiles = profiles
+
     def _load_profile_file(self, file_path: Path) -> Optional[GPUProfile]:
         """
         Load a single profile from a JSON file.
@@ -197,10 +213,13 @@ class ConfigManager:
         """
         Get a list of all loaded profiles.
 
+        The list is rebuilt whenever profiles are loaded, saved or deleted,
+        so callers must not modify it.
+
         Returns:
             List of GPUProfile objects.
         """
-        return list(self._profiles.values())
+        return self._profile_list
 
     def save_profile(self, profile: GPUProfile, overwrite: bool = False) -> bool:
         """
@@ -227,7 +246,9 @@ class ConfigManager:
                 json.dump(profile.to_dict(), f, indent=4)
 
             # Add to loaded profiles
-            self._profiles[profile.id] = profile
+            profiles = dict(self._profiles)
+            profiles[profile.id] = profile
+            self._publish_profiles(profiles)
             logger.info(f"Saved profile: {profile.name}")
             return True
 
@@ -252,7 +273,9 @@ class ConfigManager:
                 file_path.unlink()
 
             if profile_id in self._profiles:
-                del self._profiles[profile_id]
+                profiles = dict(self._profiles)
+                del profiles[profile_id]
+                self._publish_profiles(profiles)
 
             # Clear active profile if deleted
             if self._active_profile and self._active_profile.id == profile_id:
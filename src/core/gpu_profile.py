@@ -98,6 +98,13 @@ class GPUProfile:
         """Check if this is an NVIDIA GPU."""
         return "NVIDIA" in self.manufacturer.upper()
 
+    def display_info(self) -> str:
+        """One-line summary of compute units, VRAM and driver for UI labels."""
+        unit_name = "CUDA Cores" if self.is_nvidia else "Stream Processors"
+        return (f"🎮 {self.cuda_cores or self.stream_processors or 0} {unit_name} | "
+                f"📺 {self.vram_gb:.0f} GB {self.vram_type or 'GDDR'} | "
+                f"🔧 Driver {self.driver_version}")
+
     @property
     def is_amd(self) -> bool:
         """Check if this is an AMD GPU."""
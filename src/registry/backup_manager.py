@@ -4,14 +4,24 @@ Provides functionality to backup and restore Windows registry keys.
 """
 
 import os
+import time
+import ctypes
+import shutil
 import logging
+import tempfile
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# RegSaveKeyEx format flag for the newest binary hive layout
+REG_LATEST_FORMAT = 2
+
+# Background workers that move exported .reg files into the backup directory
+_move_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="backup-move")
+
 
 class BackupManager:
     """
@@ -26,6 +36,12 @@ class BackupManager:
         r"HKEY_LOCAL_MACHINE\SYSTEM\CurrentControlSet\Control\GraphicsDrivers",
     ]
 
+    # File suffixes of text (.reg) and binary hive (.hiv) backups
+    BACKUP_SUFFIXES = (".reg", ".hiv")
+
+    # Translation table for turning a registry path into a safe filename
+    _SAFE_TRANS = str.maketrans({"\\": "_", "{": "", "}": ""})
+
     def __init__(self, backup_dir: Optional[str] = None):
         """
         Initialize the backup manager.
@@ -48,9 +64,178 @@ class BackupManager:
         """Get the backup directory path."""
         return self._backup_dir
 
+    def _move_into_place(self, tmp_path: str, backup_path: Path) -> Path:
+        """Move an exported temp file to its final backup location."""
+        try:
+            shutil.move(tmp_path, str(backup_path))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        logger.info(f"Created backup: {backup_path}")
+        return backup_path
+
+    @staticmethod
+    def _wait_for_move(future: Future) -> Optional[Path]:
+        """Wait for a background move and return its backup path, or None if it failed."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error moving backup into place: {e}")
+            return None
+
+    @staticmethod
+    def _split_registry_path(registry_path: str):
+        """Split a full registry path into (winreg root handle, subkey path)."""
+        import winreg
+
+        roots = {
+            "HKEY_LOCAL_MACHINE": winreg.HKEY_LOCAL_MACHINE,
+            "HKLM": winreg.HKEY_LOCAL_MACHINE,
+            "HKEY_CURRENT_USER": winreg.HKEY_CURRENT_USER,
+            "HKCU": winreg.HKEY_CURRENT_USER,
+        }
+        root_name, _, subkey = registry_path.partition("\\")
+        return roots[root_name.upper()], subkey
+
+    @staticmethod
+    def _enable_privilege(name: str) -> bool:
+        """Enable a privilege (e.g. SeBackupPrivilege) on the current process token."""
+        from ctypes import wintypes
+
+        class LUID(ctypes.Structure):
+            _fields_ = [("LowPart", wintypes.DWORD), ("HighPart", wintypes.LONG)]
+
+        class TOKEN_PRIVILEGES(ctypes.Structure):
+            _fields_ = [
+                ("PrivilegeCount", wintypes.DWORD),
+                ("Luid", LUID),
+                ("Attributes", wintypes.DWORD),
+            ]
+
+        TOKEN_ADJUST_PRIVILEGES = 0x0020
+        TOKEN_QUERY = 0x0008
+        SE_PRIVILEGE_ENABLED = 0x00000002
+
+        # use_last_error makes ctypes capture GetLastError right after each
+        # call, so the AdjustTokenPrivileges status can't be clobbered
+        advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        token = wintypes.HANDLE()
+        if not advapi32.OpenProcessToken(
+            kernel32.GetCurrentProcess(),
+            TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY,
+            ctypes.byref(token)
+        ):
+            return False
+
+        try:
+            luid = LUID()
+            if not advapi32.LookupPrivilegeValueW(None, name, ctypes.byref(luid)):
+                return False
+
+            privileges = TOKEN_PRIVILEGES(1, luid, SE_PRIVILEGE_ENABLED)
+            if not advapi32.AdjustTokenPrivileges(
+                token, False, ctypes.byref(privileges), 0, None, None
+            ):
+                return False
+            # AdjustTokenPrivileges succeeds even if the privilege wasn't assigned
+            return ctypes.get_last_error() == 0
+        finally:
+            kernel32.CloseHandle(token)
+
+    def create_backup_binary(self, registry_path: str, backup_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Create a binary hive backup of a registry path using RegSaveKeyEx.
+
+        Much faster to produce and restore than a text .reg export, but not
+        human-readable. Requires Administrator (SeBackupPrivilege).
+
+        Args:
+            registry_path: Full registry path to backup (e.g., HKEY_LOCAL_MACHINE\\...)
+            backup_path: Optional destination file. Defaults to a timestamped .hiv file.
+
+        Returns:
+            Path to the backup file if successful, None otherwise.
+        """
+        import winreg
+
+        if backup_path is None:
+            safe_name = registry_path.translate(self._SAFE_TRANS)
+            filename = self._generate_backup_filename(safe_name[:50])
+            backup_path = self._backup_dir / filename.replace(".reg", ".hiv")
+
+        try:
+            if not self._enable_privilege("SeBackupPrivilege"):
+                logger.error("Could not enable SeBackupPrivilege for binary backup")
+                return None
+
+            # RegSaveKeyEx refuses to overwrite an existing file
+            if backup_path.exists():
+                backup_path.unlink()
+
+            root, subkey = self._split_registry_path(registry_path)
+            with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as key:
+                status = ctypes.windll.advapi32.RegSaveKeyExW(
+                    ctypes.c_void_p(int(key)), str(backup_path), None, REG_LATEST_FORMAT
+                )
+
+            if status == 0:
+                logger.info(f"Created binary backup: {backup_path}")
+                return backup_path
+            else:
+                logger.error(f"Failed to create binary backup: error {status}")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error creating binary backup: {e}")
+            return None
+
+    def restore_backup_binary(self, registry_path: str, backup_path: Path) -> bool:
+        """
+        Restore a binary hive backup created by create_backup_binary.
+
+        Args:
+            registry_path: Full registry path the hive was saved from.
+            backup_path: Path to the .hiv backup file.
+
+        Returns:
+            True if restored successfully, False otherwise.
+        """
+        import winreg
+
+        if not backup_path.exists():
+            logger.error(f"Backup file not found: {backup_path}")
+            return False
+
+        REG_FORCE_RESTORE = 0x00000008
+
+        try:
+            if not self._enable_privilege("SeRestorePrivilege"):
+                logger.error("Could not enable SeRestorePrivilege for binary restore")
+                return False
+
+            root, subkey = self._split_registry_path(registry_path)
+            with winreg.OpenKey(root, subkey, 0, winreg.KEY_ALL_ACCESS) as key:
+                status = ctypes.windll.advapi32.RegRestoreKeyW(
+                    ctypes.c_void_p(int(key)), str(backup_path), REG_FORCE_RESTORE
+                )
+
+            if status == 0:
+                logger.info(f"Restored binary backup: {backup_path}")
+                return True
+            else:
+                logger.error(f"Failed to restore binary backup: error {status}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error restoring binary backup: {e}")
+            return False
+
     def _generate_backup_filename(self, prefix: str = "gpu_registry") -> str:
         """Generate a timestamped backup filename."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         return f"{prefix}_{timestamp}.reg"
 
     def create_backup(self, registry_path: str, backup_name: Optional[str] = None) -> Optional[Path]:
@@ -64,18 +249,34 @@ class BackupManager:
         Returns:
             Path to the backup file if successful, None otherwise.
         """
+        future = self._export_backup(registry_path, backup_name)
+        return self._wait_for_move(future) if future else None
+
+    def _export_backup(self, registry_path: str, backup_name: Optional[str] = None) -> Optional[Future]:
+        """
+        Export a registry path to a local temp file and queue its move into the backup directory.
+
+        Returns:
+            Future resolving to the backup path once moved, or None if the export failed.
+        """
         if backup_name:
             filename = backup_name if backup_name.endswith(".reg") else f"{backup_name}.reg"
         else:
             # Create safe filename from registry path
-            safe_name = registry_path.replace("\\", "_").replace("{", "").replace("}", "")
+            safe_name = registry_path.translate(self._SAFE_TRANS)
             filename = self._generate_backup_filename(safe_name[:50])
 
         backup_path = self._backup_dir / filename
+        tmp_path = None
 
         try:
+            # Export to a local temp file first; the (possibly slow) backup
+            # directory is written in the background by _move_into_place
+            with tempfile.NamedTemporaryFile(suffix=".reg", delete=False) as tmp:
+                tmp_path = tmp.name
+
             # Use reg.exe to export the registry key
-            cmd = ["reg", "export", registry_path, str(backup_path), "/y"]
+            cmd = ["reg", "export", registry_path, tmp_path, "/y"]
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -84,8 +285,9 @@ class BackupManager:
             )
 
             if result.returncode == 0:
-                logger.info(f"Created backup: {backup_path}")
-                return backup_path
+                future = _move_executor.submit(self._move_into_place, tmp_path, backup_path)
+                tmp_path = None
+                return future
             else:
                 logger.error(f"Failed to create backup: {result.stderr}")
                 return None
@@ -94,34 +296,63 @@ class BackupManager:
             logger.error(f"Error creating backup: {e}")
             return None
 
-    def create_full_gpu_backup(self) -> List[Path]:
+        finally:
+            # The export failed before its move was queued; don't leave the temp file behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def create_full_gpu_backup(self, binary: bool = False) -> List[Path]:
         """
         Create backups of all GPU-related registry paths.
 
+        Args:
+            binary: Also save a binary hive (.hiv) of each path via RegSaveKeyEx.
+                Off by default since it requires SeBackupPrivilege.
+
         Returns:
             List of paths to created backup files.
         """
-        backups = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        moves = []
+        binary_backups = []
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
 
         for registry_path in self.GPU_REGISTRY_PATHS:
             # Create safe filename
             path_name = registry_path.split("\\")[-1][:30]
             backup_name = f"gpu_{path_name}_{timestamp}.reg"
 
-            backup_path = self.create_backup(registry_path, backup_name)
-            if backup_path:
-                backups.append(backup_path)
+            future = self._export_backup(registry_path, backup_name)
+            if future:
+                moves.append(future)
+
+            if binary:
+                hive_path = self._backup_dir / backup_name.replace(".reg", ".hiv")
+                if self.create_backup_binary(registry_path, hive_path):
+                    binary_backups.append(hive_path)
 
+        moved = [self._wait_for_move(future) for future in moves]
+        backups = [path for path in moved if path] + binary_backups
         logger.info(f"Created {len(backups)} GPU registry backups")
         return backups
 
+    def _hive_registry_path(self, backup_path: Path) -> Optional[str]:
+        """Find the GPU registry path a create_full_gpu_backup hive was saved from."""
+        for registry_path in self.GPU_REGISTRY_PATHS:
+            path_name = registry_path.split("\\")[-1][:30]
+            if backup_path.name.startswith(f"gpu_{path_name}_"):
+                return registry_path
+        return None
+
     def restore_backup(self, backup_path: Path) -> bool:
         """
         Restore a registry backup.
 
         Args:
-            backup_path: Path to the .reg backup file.
+            backup_path: Path to the .reg backup file, or a .hiv hive
+                created by create_full_gpu_backup.
 
         Returns:
             True if restored successfully, False otherwise.
@@ -130,6 +361,13 @@ class BackupManager:
             logger.error(f"Backup file not found: {backup_path}")
             return False
 
+        if backup_path.suffix == ".hiv":
+            registry_path = self._hive_registry_path(backup_path)
+            if registry_path is None:
+                logger.error(f"Unknown registry path for binary backup: {backup_path}")
+                return False
+            return self.restore_backup_binary(registry_path, backup_path)
+
         try:
             # Use reg.exe to import the registry file
             cmd = ["reg", "import", str(backup_path)]
@@ -153,14 +391,19 @@ class BackupManager:
 
     def list_backups(self) -> List[Path]:
         """
-        List all available backup files.
+        List all available backup files (.reg exports and .hiv hives).
 
         Returns:
             List of paths to backup files, sorted by modification time (newest first).
         """
-        backups = list(self._backup_dir.glob("*.reg"))
-        backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return backups
+        return [Path(entry.path) for entry in self._scan_backups()]
+
+    def _scan_backups(self) -> List[os.DirEntry]:
+        """List backup files as DirEntry objects, newest first."""
+        with os.scandir(self._backup_dir) as it:
+            entries = [e for e in it if e.name.endswith(self.BACKUP_SUFFIXES) and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        return entries
 
     def get_latest_backup(self, prefix: str = "") -> Optional[Path]:
         """
@@ -182,22 +425,24 @@ class BackupManager:
         Remove old backup files, keeping the most recent ones.
 
         Args:
-            keep_count: Number of backups to keep.
+            keep_count: Number of backups to keep of each kind (.reg and .hiv).
 
         Returns:
             Number of backups deleted.
         """
-        backups = self.list_backups()
-        to_delete = backups[keep_count:]
+        entries = self._scan_backups()
+        to_delete = []
+        for suffix in self.BACKUP_SUFFIXES:
+            to_delete.extend([e for e in entries if e.name.endswith(suffix)][keep_count:])
 
         deleted = 0
-        for backup in to_delete:
+        for entry in to_delete:
             try:
-                backup.unlink()
+                os.unlink(entry.path)
                 deleted += 1
-                logger.debug(f"Deleted old backup: {backup}")
+                logger.debug(f"Deleted old backup: {entry.path}")
             except Exception as e:
-                logger.error(f"Failed to delete backup {backup}: {e}")
+                logger.error(f"Failed to delete backup {entry.path}: {e}")
 
         logger.info(f"Cleaned up {deleted} old backups")
         return deleted
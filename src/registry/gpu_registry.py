@@ -4,12 +4,16 @@ Handles reading and modifying Windows registry entries for GPU simulation.
 """
 
 import logging
+import threading
+import time
 import winreg
-from typing import Dict, Optional, Any, List, Tuple
+from functools import partial
+from typing import Dict, Optional, Any, Iterator, List, Tuple
 from pathlib import Path
 
 from ..core.gpu_profile import GPUProfile
 from .backup_manager import get_backup_manager
+from .registry_watcher import RegistryWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +29,23 @@ class GPURegistry:
     DISPLAY_CLASS_PATH = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
     GRAPHICS_DRIVERS_PATH = r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers"
 
+    # Seconds a cached read-only registry view stays valid when its key
+    # can't be watched for change notifications
+    CACHE_TTL = 5.0
+
     # Display adapter class GUID
     DISPLAY_CLASS_GUID = "{4d36e968-e325-11ce-bfc1-08002be10318}"
 
+    # (result key, registry value name, default) read by get_current_gpu_info
+    GPU_INFO_FIELDS = (
+        ("name", "DriverDesc", "Unknown GPU"),
+        ("manufacturer", "ProviderName", "Unknown"),
+        ("driver_version", "DriverVersion", "Unknown"),
+        ("driver_date", "DriverDate", ""),
+        ("device_id", "MatchingDeviceId", ""),
+        ("hardware_id", "HardwareID", ""),
+    )
+
     def __init__(self, create_backups: bool = True):
         """
         Initialize the GPU registry manager.
@@ -37,6 +55,23 @@ class GPURegistry:
         """
         self._create_backups = create_backups
         self._backup_manager = get_backup_manager() if create_backups else None
+        # (timestamp, value) pairs for read-only views, see _fresh_cache()
+        self._gpu_info_cache: Optional[Tuple[float, Optional[Dict[str, Any]]]] = None
+        self._graphics_cfg_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Bumped by invalidate_cache(); a read only stores its result if no
+        # invalidation happened since it started, see _store_cache()
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        # Cache attributes cleared by the registry watcher instead of the TTL
+        self._watcher: Optional[RegistryWatcher] = None
+        self._watcher_started = False
+        # Readers run on QThreadPool workers, so only one may start the watcher
+        self._watcher_lock = threading.Lock()
+        self._watched_caches = set()
+        # Full key paths for the common adapter indices "0000".."0015"
+        self._adapter_paths = {
+            f"{i:04d}": f"{self.DISPLAY_CLASS_PATH}\\{i:04d}" for i in range(16)
+        }
         logger.info("GPURegistry initialized")
 
     def _open_key(self, path: str, access: int = winreg.KEY_READ) -> Optional[winreg.HKEYType]:
@@ -81,6 +116,86 @@ class GPURegistry:
                 break
         return values
 
+    @staticmethod
+    def _decode_value(data: Any) -> Any:
+        """Decode UTF-16 binary registry data to str, leaving other types as-is."""
+        if isinstance(data, bytes):
+            try:
+                return data.decode('utf-16-le').rstrip('\x00')
+            except UnicodeDecodeError:
+                pass
+        return data
+
+    def _start_watcher(self) -> None:
+        """Lazily start change notifications that clear the cached views."""
+        with self._watcher_lock:
+            if self._watcher_started:
+                return
+            self._watcher_started = True
+            self._create_watcher()
+
+    def _create_watcher(self) -> None:
+        """Create and start the registry watcher; called once under _watcher_lock."""
+        try:
+            watcher = RegistryWatcher()
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Registry change notification unavailable: {e}")
+            return
+
+        for attr, path in (
+            ("_gpu_info_cache", self._adapter_paths["0000"]),
+            ("_graphics_cfg_cache", self.GRAPHICS_DRIVERS_PATH),
+        ):
+            # Add first: on_lost may fire as soon as the thread starts
+            self._watched_caches.add(attr)
+            if not watcher.watch(
+                path,
+                self.invalidate_cache,
+                on_lost=partial(self._watched_caches.discard, attr)
+            ):
+                self._watched_caches.discard(attr)
+
+        if self._watched_caches:
+            watcher.start()
+            self._watcher = watcher
+        else:
+            watcher.close()
+
+    def _fresh_cache(self, attr: str) -> Optional[Tuple[float, Any]]:
+        """
+        Get the (timestamp, value) cache entry in attribute attr if still fresh.
+
+        Watched caches stay valid until the watcher clears them; the rest,
+        including caches whose watch was lost, fall back to CACHE_TTL.
+        The attribute is read once, since the watcher thread may clear it
+        at any time, so callers must use the returned entry. Callers that
+        then read the registry should take _cache_generation first and
+        store the result with _store_cache().
+
+        Returns:
+            The cache entry, or None if it is missing or stale.
+        """
+        self._start_watcher()
+        entry = getattr(self, attr)
+        if entry is None:
+            return None
+        if attr in self._watched_caches or time.monotonic() - entry[0] < self.CACHE_TTL:
+            return entry
+        return None
+
+    def _store_cache(self, attr: str, generation: int, value: Any) -> None:
+        """Cache value in attribute attr unless the cache was invalidated since generation."""
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                setattr(self, attr, (time.monotonic(), value))
+
+    def invalidate_cache(self) -> None:
+        """Drop cached registry views so the next read hits the registry."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._gpu_info_cache = None
+            self._graphics_cfg_cache = None
+
     def get_display_adapters(self) -> List[Dict[str, Any]]:
         """
         Get information about all display adapters from registry.
@@ -97,31 +212,31 @@ class GPURegistry:
 
         try:
             subkeys = self._get_subkeys(key)
+            prefix = self.DISPLAY_CLASS_PATH + "\\"
 
             for subkey_name in subkeys:
                 # Skip non-numeric subkeys
                 if not subkey_name.isdigit():
                     continue
 
-                adapter_path = f"{self.DISPLAY_CLASS_PATH}\\{subkey_name}"
+                adapter_path = prefix + subkey_name
                 adapter_key = self._open_key(adapter_path)
 
                 if adapter_key:
                     try:
+                        # Placeholder subkeys without a driver aren't real adapters
+                        try:
+                            winreg.QueryValueEx(adapter_key, "DriverDesc")
+                        except FileNotFoundError:
+                            continue
+
                         values = self._get_values(adapter_key)
                         adapter_info = {
-                            "index": subkey_name,
-                            "path": adapter_path,
+                            name: self._decode_value(data)
+                            for name, (data, _) in values.items()
                         }
-
-                        # Extract common values
-                        for name, (data, _) in values.items():
-                            if isinstance(data, bytes):
-                                try:
-                                    data = data.decode('utf-16-le').rstrip('\x00')
-                                except UnicodeDecodeError:
-                                    pass
-                            adapter_info[name] = data
+                        adapter_info["index"] = subkey_name
+                        adapter_info["path"] = adapter_path
 
                         adapters.append(adapter_info)
                     finally:
@@ -139,21 +254,31 @@ class GPURegistry:
         Returns:
             Dictionary with GPU information, or None if not found.
         """
-        adapters = self.get_display_adapters()
-        if not adapters:
+        generation = self._cache_generation
+        entry = self._fresh_cache("_gpu_info_cache")
+        if entry is not None:
+            info = entry[1]
+            return dict(info) if info is not None else None
+
+        # Read only the primary adapter (0000) and only the values we need
+        key = self._open_key(self._adapter_paths["0000"])
+        if not key:
+            self._store_cache("_gpu_info_cache", generation, None)
             return None
 
-        # Return the first adapter (typically the primary GPU)
-        primary = adapters[0]
+        try:
+            info = {}
+            for field, value_name, default in self.GPU_INFO_FIELDS:
+                try:
+                    data, _ = winreg.QueryValueEx(key, value_name)
+                except OSError:
+                    data = default
+                info[field] = self._decode_value(data)
+        finally:
+            winreg.CloseKey(key)
 
-        return {
-            "name": primary.get("DriverDesc", "Unknown GPU"),
-            "manufacturer": primary.get("ProviderName", "Unknown"),
-            "driver_version": primary.get("DriverVersion", "Unknown"),
-            "driver_date": primary.get("DriverDate", ""),
-            "device_id": primary.get("MatchingDeviceId", ""),
-            "hardware_id": primary.get("HardwareID", ""),
-        }
+        self._store_cache("_gpu_info_cache", generation, info)
+        return dict(info)
 
     def read_video_controller_info(self) -> List[Dict[str, Any]]:
         """
@@ -169,38 +294,47 @@ class GPURegistry:
             return controllers
 
         try:
-            # Each GUID subkey represents a video controller
-            guids = self._get_subkeys(key)
-
-            for guid in guids:
-                if not guid.startswith("{"):
-                    continue
-
-                # Each controller has numbered subkeys (0000, 0001, etc.)
-                controller_path = f"{self.VIDEO_PATH}\\{guid}\\0000"
-                controller_key = self._open_key(controller_path)
-
-                if controller_key:
-                    try:
-                        values = self._get_values(controller_key)
-                        info = {"guid": guid, "path": controller_path}
-
-                        for name, (data, _) in values.items():
-                            if isinstance(data, bytes):
-                                try:
-                                    data = data.decode('utf-16-le').rstrip('\x00')
-                                except UnicodeDecodeError:
-                                    pass
-                            info[name] = data
-
-                        controllers.append(info)
-                    finally:
-                        winreg.CloseKey(controller_key)
+            for guid, controller_path, values in self._iter_controllers(key):
+                info = {"guid": guid, "path": controller_path}
+                for name, data, _ in values:
+                    info[name] = self._decode_value(data)
+                controllers.append(info)
         finally:
             winreg.CloseKey(key)
 
         return controllers
 
+    def _iter_controllers(
+        self, key: winreg.HKEYType
+    ) -> Iterator[Tuple[str, str, List[Tuple[str, Any, int]]]]:
+        """
+        Enumerate video controllers under an open Control\\Video key in one pass.
+
+        Yields:
+            (guid, controller_path, [(name, data, type), ...]) for each controller.
+        """
+        num_subkeys, _, _ = winreg.QueryInfoKey(key)
+
+        for i in range(num_subkeys):
+            guid = winreg.EnumKey(key, i)
+            # Each GUID subkey represents a video controller
+            if not guid.startswith("{"):
+                continue
+
+            # Each controller has numbered subkeys (0000, 0001, etc.)
+            controller_path = f"{self.VIDEO_PATH}\\{guid}\\0000"
+            controller_key = self._open_key(controller_path)
+            if controller_key is None:
+                continue
+
+            try:
+                _, num_values, _ = winreg.QueryInfoKey(controller_key)
+                values = [winreg.EnumValue(controller_key, j) for j in range(num_values)]
+            finally:
+                winreg.CloseKey(controller_key)
+
+            yield guid, controller_path, values
+
     def apply_gpu_profile(self, profile: GPUProfile, adapter_index: str = "0000") -> bool:
         """
         Apply a GPU profile's registry entries.
@@ -216,9 +350,12 @@ class GPURegistry:
         """
         if self._create_backups and self._backup_manager:
             logger.info("Creating backup before applying GPU profile...")
-            self._backup_manager.create_full_gpu_backup()
+            self._backup_manager.create_full_gpu_backup(binary=True)
 
-        adapter_path = f"{self.DISPLAY_CLASS_PATH}\\{adapter_index}"
+        adapter_path = (
+            self._adapter_paths.get(adapter_index)
+            or f"{self.DISPLAY_CLASS_PATH}\\{adapter_index}"
+        )
 
         try:
             key = winreg.OpenKey(
@@ -270,6 +407,7 @@ class GPURegistry:
             return False
         finally:
             winreg.CloseKey(key)
+            self.invalidate_cache()
 
     def get_graphics_drivers_config(self) -> Dict[str, Any]:
         """
@@ -278,6 +416,11 @@ class GPURegistry:
         Returns:
             Dictionary of GraphicsDrivers settings.
         """
+        generation = self._cache_generation
+        entry = self._fresh_cache("_graphics_cfg_cache")
+        if entry is not None:
+            return dict(entry[1])
+
         config = {}
         key = self._open_key(self.GRAPHICS_DRIVERS_PATH)
 
@@ -289,7 +432,8 @@ class GPURegistry:
             finally:
                 winreg.CloseKey(key)
 
-        return config
+        self._store_cache("_graphics_cfg_cache", generation, config)
+        return dict(config)
 
 
 # Singleton instance
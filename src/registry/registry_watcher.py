@@ -0,0 +1,152 @@
+"""
+Registry Change Watcher
+Signals callbacks when watched registry keys change, using RegNotifyChangeKeyValue.
+"""
+
+import ctypes
+import logging
+import threading
+import winreg
+from ctypes import wintypes
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# RegNotifyChangeKeyValue filter flags
+REG_NOTIFY_CHANGE_NAME = 0x00000001
+REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+
+WAIT_OBJECT_0 = 0x00000000
+WAIT_FAILED = 0xFFFFFFFF
+INFINITE = 0xFFFFFFFF
+
+
+class RegistryWatcher(threading.Thread):
+    """
+    Background thread that waits on change notifications for a set of
+    HKEY_LOCAL_MACHINE keys and invokes a callback when one changes.
+
+    Watches must be added before start(). Asynchronous registry
+    notifications are bound to the registering thread, so all keys are
+    armed from inside run(). A watch that cannot be armed, and every
+    watch once the thread exits, is reported through its on_lost callback.
+    """
+
+    def __init__(self):
+        super().__init__(name="registry-watcher", daemon=True)
+        self._kernel32 = ctypes.windll.kernel32
+        self._advapi32 = ctypes.windll.advapi32
+
+        self._kernel32.CreateEventW.restype = wintypes.HANDLE
+        self._kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+
+        self._watches: List[Tuple[winreg.HKEYType, int, Callable[[], None]]] = []
+        self._lost_callbacks: List[Optional[Callable[[], None]]] = []
+        self._stop_event = self._kernel32.CreateEventW(None, True, False, None)
+
+    def watch(
+        self,
+        path: str,
+        callback: Callable[[], None],
+        on_lost: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """
+        Register a key to watch.
+
+        Args:
+            path: Path relative to HKEY_LOCAL_MACHINE.
+            callback: Called from the watcher thread whenever the key
+                or any of its subkeys changes.
+            on_lost: Called once, from the watcher thread, when changes
+                to the key will no longer be reported (the notification
+                could not be armed, or the watcher stopped).
+
+        Returns:
+            True if the key could be opened for notification, False otherwise.
+        """
+        try:
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_NOTIFY)
+        except OSError as e:
+            logger.debug(f"Could not open {path} for change notification: {e}")
+            return False
+
+        event = self._kernel32.CreateEventW(None, True, False, None)
+        if not event:
+            winreg.CloseKey(key)
+            return False
+
+        self._watches.append((key, event, callback))
+        self._lost_callbacks.append(on_lost)
+        return True
+
+    def _arm(self, key: winreg.HKEYType, event: int) -> bool:
+        """Request a one-shot notification for the next change under key."""
+        status = self._advapi32.RegNotifyChangeKeyValue(
+            ctypes.c_void_p(int(key)),
+            True,
+            REG_NOTIFY_CHANGE_NAME | REG_NOTIFY_CHANGE_LAST_SET,
+            wintypes.HANDLE(event),
+            True
+        )
+        return status == 0
+
+    def _report_lost(self, index: int) -> None:
+        """Invoke a watch's on_lost callback, at most once."""
+        on_lost = self._lost_callbacks[index]
+        self._lost_callbacks[index] = None
+        if on_lost is None:
+            return
+        try:
+            on_lost()
+        except Exception as e:
+            logger.error(f"Registry watch-lost callback failed: {e}")
+
+    def run(self) -> None:
+        for index, (key, event, _) in enumerate(self._watches):
+            if not self._arm(key, event):
+                logger.warning("Could not arm registry change notification")
+                self._report_lost(index)
+
+        handles = (wintypes.HANDLE * (len(self._watches) + 1))(
+            self._stop_event, *(event for _, event, _ in self._watches)
+        )
+
+        while True:
+            result = self._kernel32.WaitForMultipleObjects(
+                len(handles), handles, False, INFINITE
+            )
+            if result == WAIT_FAILED or result == WAIT_OBJECT_0:
+                break
+
+            index = result - WAIT_OBJECT_0 - 1
+            if not 0 <= index < len(self._watches):
+                break
+
+            key, event, callback = self._watches[index]
+            # Re-arm before the callback so a change made meanwhile isn't missed
+            self._kernel32.ResetEvent(wintypes.HANDLE(event))
+            if not self._arm(key, event):
+                logger.warning("Could not re-arm registry change notification")
+                self._report_lost(index)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Registry change callback failed: {e}")
+
+        for index in range(len(self._watches)):
+            self._report_lost(index)
+        self.close()
+
+    def stop(self) -> None:
+        """Stop watching and release all handles."""
+        self._kernel32.SetEvent(wintypes.HANDLE(self._stop_event))
+
+    def close(self) -> None:
+        """Close watched keys and events. Use directly only if never started."""
+        for key, event, _ in self._watches:
+            winreg.CloseKey(key)
+            self._kernel32.CloseHandle(wintypes.HANDLE(event))
+        self._watches = []
+        self._lost_callbacks = []
+        self._kernel32.CloseHandle(wintypes.HANDLE(self._stop_event))
+
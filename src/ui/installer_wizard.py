@@ -4,27 +4,93 @@ A 5-step PyQt5 wizard for streamlined GPU simulation setup.
 """
 
 import sys
+import time
 import logging
+import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from PyQt5.QtWidgets import (
     QWizard, QWizardPage, QVBoxLayout, QHBoxLayout, QLabel,
     QComboBox, QCheckBox, QProgressBar, QGroupBox, QSpinBox,
-    QPushButton, QTextEdit, QFrame, QMessageBox, QApplication
+    QPushButton, QPlainTextEdit, QFrame, QMessageBox, QApplication
 )
 from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, QAbstractListModel, QModelIndex
+)
 
 # Ensure project root is in path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Source directories handed to the component installers
+NVIDIA_PANEL_DIR = PROJECT_ROOT / "nvidia_panel"
+GFE_DIR = PROJECT_ROOT / "geforce_experience"
 
 from src.core.config_manager import get_config_manager
 from src.core.gpu_profile import GPUProfile
+from src.ui import resources_rc  # noqa: F401  registers :/themes/*
+from src.ui.theme import load_qss
+
+# Installer back-ends, resolved once at import; None when unavailable
+try:
+    from src.registry.gpu_registry import get_gpu_registry
+except ImportError:
+    get_gpu_registry = None
+
+try:
+    from nvidia_panel.installer import install_nvidia_control_panel
+except ImportError:
+    install_nvidia_control_panel = None
+
+try:
+    from geforce_experience.gfe_installer import install_geforce_experience
+except ImportError:
+    install_geforce_experience = None
 
 logger = logging.getLogger(__name__)
 
+# Dark theme applied to the whole wizard, loaded once from the Qt resource blob
+DARK_THEME_QSS = load_qss(":/themes/wizard_dark.qss")
+
+# Popen flags for tools launched from the wizard (Windows-only; 0 elsewhere)
+_DETACHED_FLAGS = (getattr(subprocess, "DETACHED_PROCESS", 0)
+                   | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0))
+
+# Fonts shared by all wizard pages (QFont is copied by value on setFont)
+_FONT_UI10 = QFont("Segoe UI", 10)
+_FONT_UI11 = QFont("Segoe UI", 11)
+_FONT_MONO = QFont("Consolas", 9)
+
+
+class ProfileListModel(QAbstractListModel):
+    """List model over GPU profiles that formats combo text on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._profiles: List[GPUProfile] = []
+
+    def set_profiles(self, profiles: List[GPUProfile]) -> None:
+        """Replace the model contents in a single reset."""
+        self.beginResetModel()
+        self._profiles = list(profiles)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._profiles)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        profile = self._profiles[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{profile.name} ({profile.vram_gb:.0f} GB)"
+        if role == Qt.UserRole:
+            return profile
+        return None
+
 
 class WelcomePage(QWizardPage):
     """Step 1: Welcome and GPU Profile Selection."""
@@ -50,7 +116,7 @@ class WelcomePage(QWizardPage):
             "⚠️ Administrator privileges are required for system modifications."
         )
         welcome_label.setWordWrap(True)
-        welcome_label.setFont(QFont("Segoe UI", 10))
+        welcome_label.setFont(_FONT_UI10)
         layout.addWidget(welcome_label)
 
         layout.addSpacing(20)
@@ -61,19 +127,13 @@ class WelcomePage(QWizardPage):
 
         self._profile_combo = QComboBox()
         self._profile_combo.setMinimumHeight(35)
-        self._profile_combo.setFont(QFont("Segoe UI", 11))
+        self._profile_combo.setFont(_FONT_UI11)
 
-        # Load profiles
-        profiles = self._config_manager.list_profiles()
-        for profile in profiles:
-            display_text = f"{profile.name} ({profile.vram_gb:.0f} GB)"
-            self._profile_combo.addItem(display_text, profile)
-
-        # Default to first NVIDIA profile
-        for i, profile in enumerate(profiles):
-            if profile.is_nvidia:
-                self._profile_combo.setCurrentIndex(i)
-                break
+        # Profiles are loaded on first show, see _ensure_profiles_loaded()
+        self._profile_model = ProfileListModel(self._profile_combo)
+        self._profile_combo.setModel(self._profile_model)
+        self._profiles_loaded = False
+        self._id_to_index: Dict[str, int] = {}
 
         profile_layout.addWidget(self._profile_combo)
 
@@ -81,7 +141,6 @@ class WelcomePage(QWizardPage):
         self._info_label = QLabel()
         self._info_label.setStyleSheet("color: #76b900;")  # NVIDIA green
         self._profile_combo.currentIndexChanged.connect(self._update_info)
-        self._update_info()
         profile_layout.addWidget(self._info_label)
 
         layout.addWidget(profile_group)
@@ -90,23 +149,62 @@ class WelcomePage(QWizardPage):
         # Register field for wizard access
         self.registerField("profileIndex", self._profile_combo)
 
+    def showEvent(self, event):
+        self._ensure_profiles_loaded()
+        super().showEvent(event)
+
+    def _ensure_profiles_loaded(self):
+        """Populate the profile combo the first time it is needed."""
+        if self._profiles_loaded:
+            return
+        self._profiles_loaded = True
+
+        profiles = self._config_manager.list_profiles()
+
+        # Populate in one model reset; _update_info runs once at the end
+        self._profile_combo.blockSignals(True)
+        self._profile_model.set_profiles(profiles)
+        self._id_to_index = {p.id: i for i, p in enumerate(profiles)}
+
+        # Default to first NVIDIA profile
+        default_index = next((i for i, p in enumerate(profiles) if p.is_nvidia), None)
+        if default_index is not None:
+            self._profile_combo.setCurrentIndex(default_index)
+        self._profile_combo.blockSignals(False)
+
+        self._update_info()
+
     def _update_info(self):
         profile = self._profile_combo.currentData()
         if profile:
-            info = (f"🎮 {profile.cuda_cores or profile.stream_processors or 0} "
-                    f"{'CUDA Cores' if profile.is_nvidia else 'Stream Processors'} | "
-                    f"📺 {profile.vram_gb:.0f} GB {profile.vram_type or 'GDDR'} | "
-                    f"🔧 Driver {profile.driver_version}")
-            self._info_label.setText(info)
+            self._info_label.setText(profile.display_info())
+
+    def select_profile_by_id(self, profile_id: str) -> bool:
+        """
+        Select the profile with the given ID in the combo.
+
+        Returns:
+            True if the profile was found and selected, False otherwise.
+        """
+        self._ensure_profiles_loaded()
+        index = self._id_to_index.get(profile_id)
+        if index is None:
+            return False
+        self._profile_combo.setCurrentIndex(index)
+        return True
 
     def get_selected_profile(self) -> Optional[GPUProfile]:
         """Return the currently selected GPU profile."""
+        self._ensure_profiles_loaded()
         return self._profile_combo.currentData()
 
 
 class ConfigPage(QWizardPage):
     """Step 2: Configuration Options."""
 
+    # Quick-select VRAM sizes shown next to the spin box
+    QUICK_VRAM_GB = (4, 8, 12, 16, 24)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("Configure GPU Settings")
@@ -129,10 +227,11 @@ class ConfigPage(QWizardPage):
         vram_layout.addWidget(self._vram_spin)
 
         # Quick VRAM buttons
-        for gb in [4, 8, 12, 16, 24]:
+        for gb in self.QUICK_VRAM_GB:
             btn = QPushButton(f"{gb}GB")
             btn.setMaximumWidth(60)
-            btn.clicked.connect(lambda checked, v=gb: self._vram_spin.setValue(v))
+            # PyQt drops clicked's checked arg as setValue's argument is bound
+            btn.clicked.connect(partial(self._vram_spin.setValue, gb))
             vram_layout.addWidget(btn)
 
         vram_layout.addStretch()
@@ -232,26 +331,60 @@ class ComponentsPage(QWizardPage):
         self.registerField("installGFE", self._install_gfe)
 
 
-class InstallWorker(QThread):
-    """Background worker for installation tasks."""
+class InstallWorkerSignals(QObject):
+    """Signals for InstallWorker (QRunnable can't define signals itself)."""
 
     progress = pyqtSignal(int, str)  # percent, message
     finished = pyqtSignal(bool, str)  # success, message
 
-    def __init__(self, profile: GPUProfile, vram_gb: int,
-                 apply_registry: bool, install_panel: bool, install_gfe: bool):
+
+class InstallWorker(QRunnable):
+    """
+    Background worker for installation tasks.
+
+    Runs on the global QThreadPool and is reused across runs: call reset()
+    with new settings before starting it again.
+    """
+
+    # Minimum seconds between same-message progress signals (~30 Hz)
+    PROGRESS_INTERVAL = 0.033
+
+    def __init__(self, profile: Optional[GPUProfile] = None, vram_gb: int = 0,
+                 apply_registry: bool = False, install_panel: bool = False,
+                 install_gfe: bool = False):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = InstallWorkerSignals()
+        self.reset(profile, vram_gb, apply_registry, install_panel, install_gfe)
+
+    def reset(self, profile: Optional[GPUProfile], vram_gb: int,
+              apply_registry: bool, install_panel: bool, install_gfe: bool):
+        """Load settings for the next run and clear state from the previous one."""
         self._profile = profile
         self._vram_gb = vram_gb
         self._apply_registry = apply_registry
         self._install_panel = install_panel
         self._install_gfe = install_gfe
         self._errors = []
+        self._last_emit = 0.0
+        self._last_message = ""
+
+    def _emit_progress(self, percent: int, message: str):
+        """
+        Emit progress, coalescing same-message updates that arrive faster
+        than PROGRESS_INTERVAL. New step messages are never dropped.
+        """
+        now = time.monotonic()
+        if (percent in (0, 100) or message != self._last_message
+                or now - self._last_emit >= self.PROGRESS_INTERVAL):
+            self.signals.progress.emit(percent, message)
+            self._last_emit = now
+            self._last_message = message
 
     def run(self):
-        total_steps = sum([self._apply_registry, self._install_panel, self._install_gfe])
+        total_steps = int(self._apply_registry) + int(self._install_panel) + int(self._install_gfe)
         if total_steps == 0:
-            self.finished.emit(True, "No actions selected.")
+            self.signals.finished.emit(True, "No actions selected.")
             return
 
         current_step = 0
@@ -259,79 +392,85 @@ class InstallWorker(QThread):
         try:
             # Step 1: Apply Registry
             if self._apply_registry:
-                self.progress.emit(int(current_step / total_steps * 100),
-                                   "Applying GPU profile to registry...")
+                self._emit_progress(int(current_step / total_steps * 100),
+                                    "Applying GPU profile to registry...")
 
                 # Modify profile VRAM if changed
                 if self._vram_gb != int(self._profile.vram_gb):
                     self._profile.vram_mb = self._vram_gb * 1024
 
-                try:
-                    from src.registry.gpu_registry import get_gpu_registry
-                    registry = get_gpu_registry()
-                    success = registry.apply_gpu_profile(self._profile)
-                    if not success:
-                        self._errors.append("Registry: Failed to apply (run as Administrator)")
-                except Exception as e:
-                    self._errors.append(f"Registry: {str(e)}")
+                if get_gpu_registry is None:
+                    self._errors.append("Registry: Not available on this system")
+                else:
+                    try:
+                        registry = get_gpu_registry()
+                        success = registry.apply_gpu_profile(self._profile)
+                        if not success:
+                            self._errors.append("Registry: Failed to apply (run as Administrator)")
+                    except Exception as e:
+                        self._errors.append(f"Registry: {str(e)}")
 
                 current_step += 1
 
             # Step 2: Install NVIDIA Control Panel
             if self._install_panel:
-                self.progress.emit(int(current_step / total_steps * 100),
-                                   "Installing NVIDIA Control Panel...")
-
-                try:
-                    from nvidia_panel.installer import install_nvidia_control_panel
-                    nvidia_panel_dir = Path(__file__).parent.parent.parent / "nvidia_panel"
-                    success, msg = install_nvidia_control_panel(nvidia_panel_dir)
-                    if not success:
-                        self._errors.append(f"NVIDIA Panel: {msg}")
-                except Exception as e:
-                    self._errors.append(f"NVIDIA Panel: {str(e)}")
+                self._emit_progress(int(current_step / total_steps * 100),
+                                    "Installing NVIDIA Control Panel...")
+
+                if install_nvidia_control_panel is None:
+                    self._errors.append("NVIDIA Panel: Installer not available")
+                else:
+                    try:
+                        success, msg = install_nvidia_control_panel(NVIDIA_PANEL_DIR)
+                        if not success:
+                            self._errors.append(f"NVIDIA Panel: {msg}")
+                    except Exception as e:
+                        self._errors.append(f"NVIDIA Panel: {str(e)}")
 
                 current_step += 1
 
             # Step 3: Install GeForce Experience
             if self._install_gfe:
-                self.progress.emit(int(current_step / total_steps * 100),
-                                   "Installing GeForce Experience...")
-
-                try:
-                    # Try to import GFE installer if it exists
-                    from geforce_experience.gfe_installer import install_geforce_experience
-                    gfe_dir = Path(__file__).parent.parent.parent / "geforce_experience"
-                    success, msg = install_geforce_experience(gfe_dir)
-                    if not success:
-                        self._errors.append(f"GeForce Experience: {msg}")
-                except ImportError:
-                    # GFE installer not yet created - skip gracefully
+                self._emit_progress(int(current_step / total_steps * 100),
+                                    "Installing GeForce Experience...")
+
+                if install_geforce_experience is None:
+                    # GFE installer not available - skip gracefully
                     self._errors.append("GeForce Experience: Installer not available yet")
-                except Exception as e:
-                    self._errors.append(f"GeForce Experience: {str(e)}")
+                else:
+                    try:
+                        success, msg = install_geforce_experience(GFE_DIR)
+                        if not success:
+                            self._errors.append(f"GeForce Experience: {msg}")
+                    except Exception as e:
+                        self._errors.append(f"GeForce Experience: {str(e)}")
 
                 current_step += 1
 
-            self.progress.emit(100, "Installation complete!")
+            self._emit_progress(100, "Installation complete!")
 
             if self._errors:
-                self.finished.emit(False, "Completed with errors:\n• " + "\n• ".join(self._errors))
+                self.signals.finished.emit(False, "Completed with errors:\n• " + "\n• ".join(self._errors))
             else:
-                self.finished.emit(True, "All components installed successfully!")
+                self.signals.finished.emit(True, "All components installed successfully!")
 
         except Exception as e:
-            self.finished.emit(False, f"Installation failed: {str(e)}")
+            self.signals.finished.emit(False, f"Installation failed: {str(e)}")
 
 
 class InstallPage(QWizardPage):
     """Step 4: Installation Progress."""
 
+    # Upper bound on lines kept in the install log
+    MAX_LOG_LINES = 1000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("Installing Components")
         self.setSubTitle("Please wait while components are being installed...")
-        self._worker = None
+        self._worker: Optional[InstallWorker] = None
+        self._worker_busy = False
+        self._thread_pool = QThreadPool.globalInstance()
         self._install_complete = False
         self._setup_ui()
 
@@ -347,13 +486,15 @@ class InstallPage(QWizardPage):
 
         # Status label
         self._status_label = QLabel("Preparing installation...")
-        self._status_label.setFont(QFont("Segoe UI", 10))
+        self._status_label.setFont(_FONT_UI10)
         layout.addWidget(self._status_label)
 
         # Log output
-        self._log_text = QTextEdit()
+        self._log_text = QPlainTextEdit()
         self._log_text.setReadOnly(True)
-        self._log_text.setFont(QFont("Consolas", 9))
+        self._log_text.setFont(_FONT_MONO)
+        # Oldest lines are evicted once the log reaches this many blocks
+        self._log_text.setMaximumBlockCount(self.MAX_LOG_LINES)
         self._log_text.setMaximumHeight(200)
         layout.addWidget(self._log_text)
 
@@ -361,6 +502,10 @@ class InstallPage(QWizardPage):
 
     def initializePage(self):
         """Start installation when page becomes visible."""
+        if self._worker_busy:
+            # Back then Next while installing - let the current run finish
+            return
+
         self._install_complete = False
         self._log_text.clear()
         self._progress_bar.setValue(0)
@@ -372,7 +517,7 @@ class InstallPage(QWizardPage):
         # Get configuration from wizard
         profile = wizard.get_selected_profile()
         if not profile:
-            self._log_text.append("❌ No profile selected!")
+            self._log_text.appendPlainText("❌ No profile selected!")
             return
 
         vram_gb = self.field("vramGB")
@@ -380,43 +525,61 @@ class InstallPage(QWizardPage):
         install_panel = self.field("installPanel")
         install_gfe = self.field("installGFE")
 
-        self._log_text.append(f"📦 Profile: {profile.name}")
-        self._log_text.append(f"📺 VRAM: {vram_gb} GB")
-        self._log_text.append(f"🔧 Apply Registry: {'Yes' if apply_registry else 'No'}")
-        self._log_text.append(f"🖥️ Install NVIDIA Panel: {'Yes' if install_panel else 'No'}")
-        self._log_text.append(f"🎮 Install GeForce Experience: {'Yes' if install_gfe else 'No'}")
-        self._log_text.append("")
+        # Create the worker once, then reuse it for later runs
+        if self._worker is None:
+            self._worker = InstallWorker()
+            self._worker.signals.progress.connect(self._on_progress)
+            self._worker.signals.finished.connect(self._on_finished)
 
-        # Create and start worker
-        self._worker = InstallWorker(
+        self._worker.reset(
             profile=profile,
             vram_gb=vram_gb,
             apply_registry=apply_registry,
             install_panel=install_panel,
             install_gfe=install_gfe
         )
-        self._worker.progress.connect(self._on_progress)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.start()
+        self._worker_busy = True
+
+        # Let the page paint before filling the log and starting work
+        QTimer.singleShot(0, partial(
+            self._start_install, profile, vram_gb, apply_registry, install_panel, install_gfe
+        ))
+
+    def _start_install(self, profile: GPUProfile, vram_gb: int,
+                       apply_registry: bool, install_panel: bool, install_gfe: bool):
+        """Write the install summary and hand the worker to the thread pool."""
+        # Trailing "" leaves a blank line before the progress messages
+        self._log_text.setPlainText("\n".join([
+            f"📦 Profile: {profile.name}",
+            f"📺 VRAM: {vram_gb} GB",
+            f"🔧 Apply Registry: {'Yes' if apply_registry else 'No'}",
+            f"🖥️ Install NVIDIA Panel: {'Yes' if install_panel else 'No'}",
+            f"🎮 Install GeForce Experience: {'Yes' if install_gfe else 'No'}",
+            "",
+        ]))
+        self._thread_pool.start(self._worker)
 
     def _on_progress(self, percent: int, message: str):
         self._progress_bar.setValue(percent)
         self._status_label.setText(message)
-        self._log_text.append(f"▶ {message}")
+        self._log_text.appendPlainText(f"▶ {message}")
 
     def _on_finished(self, success: bool, message: str):
+        self._worker_busy = False
         self._install_complete = True
         self._progress_bar.setValue(100)
 
         if success:
             self._status_label.setText("✅ " + message)
-            self._log_text.append(f"\n✅ {message}")
+            self._log_text.appendPlainText(f"\n✅ {message}")
         else:
             self._status_label.setText("⚠️ " + message.split('\n')[0])
-            self._log_text.append(f"\n⚠️ {message}")
+            self._log_text.appendPlainText(f"\n⚠️ {message}")
 
-        # Enable next button
-        self.completeChanged.emit()
+        # Enable next button directly; isComplete() still covers page revisits
+        wizard = self.wizard()
+        if wizard is not None:
+            wizard.button(QWizard.NextButton).setEnabled(True)
 
     def isComplete(self):
         return self._install_complete
@@ -441,7 +604,7 @@ class CompletePage(QWizardPage):
             "Follow the verification steps below to confirm everything is working."
         )
         success_label.setWordWrap(True)
-        success_label.setFont(QFont("Segoe UI", 11))
+        success_label.setFont(_FONT_UI11)
         layout.addWidget(success_label)
 
         layout.addSpacing(10)
@@ -458,10 +621,12 @@ class CompletePage(QWizardPage):
             ("5. Check Windows Settings", "Settings → System → Display → Advanced"),
         ]
 
-        for step, detail in steps:
-            step_label = QLabel(f"<b>{step}</b><br><small>{detail}</small>")
-            step_label.setTextFormat(Qt.RichText)
-            verify_layout.addWidget(step_label)
+        # One rich-text label for all steps so the HTML is laid out once
+        steps_label = QLabel("<br><br>".join(
+            f"<b>{step}</b><br><small>{detail}</small>" for step, detail in steps
+        ))
+        steps_label.setTextFormat(Qt.RichText)
+        verify_layout.addWidget(steps_label)
 
         layout.addWidget(verify_group)
 
@@ -480,9 +645,13 @@ class CompletePage(QWizardPage):
         layout.addStretch()
 
     def _run_command(self, cmd: str):
-        import subprocess
+        # Launch the executable directly (no cmd.exe) and detach it from us
         try:
-            subprocess.Popen(cmd, shell=True)
+            subprocess.Popen(
+                [f"{cmd}.exe"],
+                creationflags=_DETACHED_FLAGS,
+                close_fds=True
+            )
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to run {cmd}: {e}")
 
@@ -516,83 +685,10 @@ class InstallerWizard(QWizard):
 
         # Set initial profile if provided
         if profile:
-            # Find and select the matching profile in combo
-            combo = self._welcome_page._profile_combo
-            for i in range(combo.count()):
-                if combo.itemData(i) and combo.itemData(i).id == profile.id:
-                    combo.setCurrentIndex(i)
-                    break
+            self._welcome_page.select_profile_by_id(profile.id)
 
     def _apply_dark_theme(self):
-        self.setStyleSheet("""
-            QWizard {
-                background-color: #1e1e1e;
-            }
-            QWizardPage {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QGroupBox {
-                color: #76b900;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QComboBox, QSpinBox {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                padding: 5px;
-            }
-            QComboBox:hover, QSpinBox:hover {
-                border: 1px solid #76b900;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QPushButton {
-                background-color: #76b900;
-                color: #000000;
-                border: none;
-                border-radius: 3px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8bc34a;
-            }
-            QPushButton:pressed {
-                background-color: #5a8f00;
-            }
-            QProgressBar {
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                text-align: center;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                background-color: #76b900;
-            }
-            QTextEdit {
-                background-color: #0d0d0d;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-            }
-        """)
+        self.setStyleSheet(DARK_THEME_QSS)
 
     def get_selected_profile(self) -> Optional[GPUProfile]:
         """Return the currently selected GPU profile from welcome page."""
@@ -3,35 +3,128 @@ Main Window
 Enhanced GPU-SIM Control Panel with modular UI.
 """
 
+import os
 import sys
 import logging
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Set
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTreeWidget, QTreeWidgetItem, QStackedWidget, QMenuBar, QMenu,
+    QApplication, QMainWindow, QWidget, QVBoxLayout,
+    QListView, QStackedWidget, QMenuBar, QMenu,
     QAction, QStatusBar, QSplitter, QMessageBox, QFileDialog
 )
-from PyQt5.QtGui import QIcon, QFont, QPainter, QPixmap, QColor
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QIcon, QFont, QPainter, QPixmap, QColor, QStandardItemModel, QStandardItem
+from PyQt5.QtCore import (
+    Qt, QModelIndex, QTimer, QObject, QThread, QThreadPool, QRunnable, QSignalBlocker,
+    pyqtSignal, pyqtSlot
+)
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path (once, even if this module is re-imported)
+project_root = Path(__file__).resolve().parents[2]
+_project_root_str = str(project_root)
+if _project_root_str not in sys.path:
+    sys.path.insert(0, _project_root_str)
 
 from src.core.config_manager import get_config_manager, ConfigManager
 from src.core.gpu_profile import GPUProfile
 from src.ui.widgets.gpu_selector import GPUSelector
-from src.ui.panels.home_panel import HomePanel
-from src.ui.panels.gpu_info_panel import GPUInfoPanel
-from src.ui.panels.profile_editor import ProfileEditorPanel
-from src.ui.panels.verification_panel import VerificationPanel
-from src.ui.system_tray import SystemTrayManager
-from src.ui.theme import Theme
+from src.ui import resources_rc  # noqa: F401  registers :/themes/*
+from src.ui.theme import Theme, dark_palette, load_qss
 
 logger = logging.getLogger(__name__)
 
+MAIN_THEME_QSS_PATH = ":/themes/main_dark.qss"
+
+
+@lru_cache(maxsize=1)
+def _load_qss() -> str:
+    """Read the main window dark theme stylesheet (once per process)."""
+    return load_qss(MAIN_THEME_QSS_PATH)
+
+
+ICONS_DIR = project_root / "assets" / "icons"
+DOCS_DIR = project_root / "docs"
+
+WINDOW_ICON_PATHS = (
+    ICONS_DIR / "gpu_sim.ico",
+    Path("C:/Dell/Drivers/log/294666_nvidia_icon.ico"),
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_window_icon() -> Optional[QIcon]:
+    """Find the first existing window icon (checked once per process)."""
+    for icon_path in WINDOW_ICON_PATHS:
+        if icon_path.exists():
+            return QIcon(str(icon_path))
+    return None
+
+
+class _ProfileLoader(QObject):
+    """Reloads GPU profiles from disk on a worker thread."""
+
+    finished = pyqtSignal(int)  # Number of profiles loaded
+
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__()
+        self._config_manager = config_manager
+
+    @pyqtSlot()
+    def run(self) -> None:
+        self.finished.emit(self._config_manager.load_profiles())
+
+
+class _TaskSignals(QObject):
+    """Signals for _TaskWorker (QRunnable can't define signals itself)."""
+
+    finished = pyqtSignal(object)  # Task result
+    failed = pyqtSignal(str)  # Error message
+
+
+class _TaskWorker(QRunnable):
+    """Runs a blocking callable (registry queries, backups) on the global QThreadPool."""
+
+    def __init__(self, task: Callable[[], Any]):
+        super().__init__()
+        self.signals = _TaskSignals()
+        self._task = task
+
+    def run(self) -> None:
+        try:
+            result = self._task()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+# Panel factories. The imports are deferred to first use but written out
+# statically, so PyInstaller still bundles the panel modules.
+def _create_home_panel() -> QWidget:
+    """Build the Home panel."""
+    from src.ui.panels.home_panel import HomePanel
+    return HomePanel()
+
+
+def _create_gpu_info_panel() -> QWidget:
+    """Build the GPU Information panel."""
+    from src.ui.panels.gpu_info_panel import GPUInfoPanel
+    return GPUInfoPanel()
+
+
+def _create_profile_editor_panel() -> QWidget:
+    """Build the Profile Editor panel."""
+    from src.ui.panels.profile_editor import ProfileEditorPanel
+    return ProfileEditorPanel()
+
+
+def _create_verification_panel() -> QWidget:
+    """Build the Verification panel."""
+    from src.ui.panels.verification_panel import VerificationPanel
+    return VerificationPanel()
+
 
 class MainWindow(QMainWindow):
     """
@@ -39,20 +132,88 @@ class MainWindow(QMainWindow):
     Enhanced version with modular panels and working features.
     """
 
+    # Menu bar layout: (menu title, [(action text, slot name, shortcut) or None for a separator])
+    MENUS = (
+        ("File", (
+            ("Load Profile...", "_on_load_profile", None),
+            ("Save Profile As...", "_on_save_profile", None),
+            None,
+            ("Refresh Profiles", "_refresh_profiles", "F5"),
+            None,
+            ("Exit", "close", "Alt+F4"),
+        )),
+        ("Tools", (
+            ("View WMI GPU Info", "_show_wmi_info", None),
+            ("View Registry Info", "_show_registry_info", None),
+            None,
+            ("Create Registry Backup", "_create_backup", None),
+        )),
+        ("Help", (
+            ("About GPU-SIM", "_show_about", None),
+            ("Documentation", "_show_docs", None),
+        )),
+    )
+
+    # Broadcast to all built panels: (profile, source panel or None)
+    profile_changed = pyqtSignal(object, object)
+
+    # Stack index of each content panel; NAV_ITEMS lists them in this order,
+    # so a navigation row index equals its panel's stack index
+    PANEL_HOME = 0
+    PANEL_GPU_INFO = 1
+    PANEL_PROFILE_EDITOR = 2
+    PANEL_VERIFICATION = 3
+
+    # Navigation entries in row order: (label, panel index)
+    NAV_ITEMS = (
+        ("Home", PANEL_HOME),
+        ("GPU Information", PANEL_GPU_INFO),
+        ("Profile Editor", PANEL_PROFILE_EDITOR),
+        ("Verification", PANEL_VERIFICATION),
+    )
+
+    # Delay before acting on a navigation change, so keyboard scrolling
+    # through the tree only builds the panel the user stops on
+    NAV_DEBOUNCE_MS = 30
+
+    # Delay for coalescing bursts of profile editor updates into one refresh
+    PROFILE_UPDATE_DEBOUNCE_MS = 50
+
+    # Panels are imported and constructed on first navigation, not at startup
+    PANEL_FACTORIES: Dict[int, Callable[[], QWidget]] = {
+        PANEL_HOME: _create_home_panel,
+        PANEL_GPU_INFO: _create_gpu_info_panel,
+        PANEL_PROFILE_EDITOR: _create_profile_editor_panel,
+        PANEL_VERIFICATION: _create_verification_panel,
+    }
+
     def __init__(self):
         super().__init__()
 
         self._config_manager = get_config_manager()
+        self._profiles_dir_str = str(self._config_manager.profiles_dir)
         self._current_profile: Optional[GPUProfile] = None
+        self._profile_status_suffix = ""
+        self._panels: Dict[int, QWidget] = {}
+        self._pending_nav_index: Optional[int] = None
+        self._about_box: Optional[QMessageBox] = None
+        self._docs_box: Optional[QMessageBox] = None
+        self._profile_thread: Optional[QThread] = None
+        self._profile_loader: Optional[_ProfileLoader] = None
+        self._refresh_done_status = "Profiles refreshed"
+        self._tasks: Set[_TaskWorker] = set()
+
+        self._pending_updated_profile: Optional[GPUProfile] = None
+        self._profile_update_timer = QTimer(self)
+        self._profile_update_timer.setSingleShot(True)
+        self._profile_update_timer.setInterval(self.PROFILE_UPDATE_DEBOUNCE_MS)
+        self._profile_update_timer.timeout.connect(self._apply_profile_update)
 
         self._setup_window()
         self._create_menus()
         self._create_ui()
         self._create_status_bar()
 
-        # Apply dark theme
-        self._apply_dark_theme()
-
         logger.info("MainWindow initialized")
 
     def _setup_window(self) -> None:
@@ -62,271 +223,129 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(900, 600)
 
         # Try to set window icon
-        icon_paths = [
-            project_root / "assets" / "icons" / "gpu_sim.ico",
-            Path("C:/Dell/Drivers/log/294666_nvidia_icon.ico"),
-        ]
-        for icon_path in icon_paths:
-            if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
-                break
-
-    def _apply_dark_theme(self) -> None:
-        """Apply a dark theme to the application."""
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {Theme.COLOR_BACKGROUND};
-            }}
-            QWidget {{
-                background-color: {Theme.COLOR_SURFACE};
-                color: {Theme.COLOR_TEXT_PRIMARY};
-                font-family: '{Theme.FONT_FAMILY}', Arial, sans-serif;
-                font-size: {Theme.FONT_BODY_SIZE}px;
-            }}
-            QTreeWidget {{
-                background-color: {Theme.COLOR_SURFACE};
-                border: none;
-                color: {Theme.COLOR_TEXT_PRIMARY};
-            }}
-            QTreeWidget::item {{
-                padding: 8px;
-                border-radius: 4px;
-            }}
-            QTreeWidget::item:hover {{
-                background-color: {Theme.COLOR_SURFACE_HOVER};
-            }}
-            QTreeWidget::item:selected {{
-                background-color: {Theme.COLOR_ACCENT};
-                color: white;
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {Theme.COLOR_BORDER};
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: {Theme.COLOR_ACCENT};
-            }}
-            QComboBox {{
-                background-color: {Theme.COLOR_BACKGROUND};
-                border: 1px solid {Theme.COLOR_BORDER};
-                border-radius: 3px;
-                padding: 5px;
-                min-width: 150px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QPushButton {{
-                background-color: {Theme.COLOR_SURFACE};
-                color: {Theme.COLOR_TEXT_PRIMARY};
-                border: 1px solid {Theme.COLOR_BORDER};
-                padding: 8px 16px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.COLOR_SURFACE_HOVER};
-                border-color: {Theme.COLOR_ACCENT};
-            }}
-            QPushButton:pressed {{
-                background-color: {Theme.COLOR_BACKGROUND};
-            }}
-            QPushButton:disabled {{
-                background-color: {Theme.COLOR_SURFACE};
-                color: {Theme.COLOR_TEXT_SECONDARY};
-                border-color: {Theme.COLOR_BORDER};
-            }}
-            QMenuBar {{
-                background-color: {Theme.COLOR_BACKGROUND};
-                border-bottom: 1px solid {Theme.COLOR_BORDER};
-            }}
-            QMenuBar::item:selected {{
-                background-color: {Theme.COLOR_ACCENT};
-            }}
-            QMenu {{
-                background-color: {Theme.COLOR_SURFACE};
-                border: 1px solid {Theme.COLOR_BORDER};
-            }}
-            QMenu::item:selected {{
-                background-color: {Theme.COLOR_ACCENT};
-            }}
-            QStatusBar {{
-                background-color: {Theme.COLOR_ACCENT};
-                color: white;
-            }}
-            QTableWidget {{
-                background-color: {Theme.COLOR_BACKGROUND};
-                gridline-color: {Theme.COLOR_BORDER};
-            }}
-            QHeaderView::section {{
-                background-color: {Theme.COLOR_SURFACE};
-                padding: 5px;
-                border: none;
-            }}
-            QCheckBox {{
-                spacing: 8px;
-            }}
-            QSlider::groove:horizontal {{
-                background-color: {Theme.COLOR_BACKGROUND};
-                height: 8px;
-                border-radius: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                background-color: {Theme.COLOR_ACCENT};
-                width: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }}
-            QSpinBox {{
-                background-color: {Theme.COLOR_BACKGROUND};
-                border: 1px solid {Theme.COLOR_BORDER};
-                padding: 5px;
-            }}
-        """)
+        icon = _resolve_window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
     def _create_menus(self) -> None:
-        """Create the menu bar."""
+        """Create the menu bar from MENUS."""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        load_profile_action = QAction("Load Profile...", self)
-        load_profile_action.triggered.connect(self._on_load_profile)
-        file_menu.addAction(load_profile_action)
-
-        save_profile_action = QAction("Save Profile As...", self)
-        save_profile_action.triggered.connect(self._on_save_profile)
-        file_menu.addAction(save_profile_action)
-
-        file_menu.addSeparator()
-
-        refresh_action = QAction("Refresh Profiles", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self._refresh_profiles)
-        file_menu.addAction(refresh_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Alt+F4")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Tools menu
-        tools_menu = menubar.addMenu("Tools")
-
-        wmi_action = QAction("View WMI GPU Info", self)
-        wmi_action.triggered.connect(self._show_wmi_info)
-        tools_menu.addAction(wmi_action)
-
-        registry_action = QAction("View Registry Info", self)
-        registry_action.triggered.connect(self._show_registry_info)
-        tools_menu.addAction(registry_action)
-
-        tools_menu.addSeparator()
-
-        backup_action = QAction("Create Registry Backup", self)
-        backup_action.triggered.connect(self._create_backup)
-        tools_menu.addAction(backup_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-
-        about_action = QAction("About GPU-SIM", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for menu_title, items in self.MENUS:
+            menu = menubar.addMenu(menu_title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
 
-        docs_action = QAction("Documentation", self)
-        docs_action.triggered.connect(self._show_docs)
-        help_menu.addAction(docs_action)
+                text, slot_name, shortcut = item
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
 
     def _create_ui(self) -> None:
         """Create the main UI layout."""
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        # No repaints while the widget tree is being assembled
+        self.setUpdatesEnabled(False)
 
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Create splitter for resizable panels
-        splitter = QSplitter(Qt.Horizontal)
+        # Splitter for resizable panels is the central widget itself
+        splitter = QSplitter(Qt.Horizontal, self)
+        splitter.setObjectName("mainSplitter")
 
         # Left sidebar
         sidebar_widget = QWidget()
+        sidebar_widget.setObjectName("sidebar")
         sidebar_layout = QVBoxLayout(sidebar_widget)
         sidebar_layout.setContentsMargins(10, 10, 10, 10)
 
         # GPU Selector at top of sidebar
         self._gpu_selector = GPUSelector(self._config_manager)
+        self._gpu_selector.setObjectName("gpuSelector")
         self._gpu_selector.profile_changed.connect(self._on_profile_changed)
         sidebar_layout.addWidget(self._gpu_selector)
 
         # Navigation tree
-        self._nav_tree = QTreeWidget()
-        self._nav_tree.setHeaderHidden(True)
-        self._nav_tree.setIndentation(20)
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(self.NAV_DEBOUNCE_MS)
+        self._nav_timer.timeout.connect(self._apply_nav_selection)
+
+        self._nav_list = QListView()
+        self._nav_list.setObjectName("navList")
+        self._nav_list.setEditTriggers(QListView.NoEditTriggers)
+        self._nav_list.setUniformItemSizes(True)
         self._create_navigation()
-        self._nav_tree.currentItemChanged.connect(self._on_nav_changed)
-        sidebar_layout.addWidget(self._nav_tree)
+        self._nav_list.selectionModel().currentChanged.connect(self._on_nav_changed)
+        sidebar_layout.addWidget(self._nav_list)
 
         splitter.addWidget(sidebar_widget)
 
         # Right content area
         self._content_stack = QStackedWidget()
+        self._content_stack.setObjectName("contentStack")
 
-        # Create panels (simplified - only essential ones)
-        self._home_panel = HomePanel()
-        self._gpu_info_panel = GPUInfoPanel()
-        self._profile_editor = ProfileEditorPanel()
-        self._verification_panel = VerificationPanel()
-
-        self._content_stack.addWidget(self._home_panel)     # Index 0
-        self._content_stack.addWidget(self._gpu_info_panel) # Index 1
-        self._content_stack.addWidget(self._profile_editor) # Index 2
-        self._content_stack.addWidget(self._verification_panel) # Index 3
-
-        # Connect profile editor updates to refresh all panels
-        self._profile_editor.profile_updated.connect(self._on_profile_updated)
+        # Placeholders keep stack indices stable until each panel is built
+        for _ in self.PANEL_FACTORIES:
+            self._content_stack.addWidget(QWidget())
+        self._get_panel(self.PANEL_HOME)
 
         splitter.addWidget(self._content_stack)
 
         # Set splitter sizes
         splitter.setSizes([280, 920])
 
-        main_layout.addWidget(splitter)
+        self.setCentralWidget(splitter)
+        self.setUpdatesEnabled(True)
+
+    def _get_panel(self, panel_index: int) -> QWidget:
+        """
+        Get a content panel, constructing it on first use.
+
+        Args:
+            panel_index: Stack index of the panel (PANEL_* constant).
+
+        Returns:
+            The panel widget.
+        """
+        panel = self._panels.get(panel_index)
+        if panel is not None:
+            return panel
+
+        panel = self.PANEL_FACTORIES[panel_index]()
+        panel.set_profile(self._current_profile)
+        self.profile_changed.connect(panel.queue_profile)
+
+        if panel_index == self.PANEL_PROFILE_EDITOR:
+            # Connect profile editor updates to refresh all panels
+            panel.profile_updated.connect(self._on_profile_updated)
+
+        # Swap the placeholder out for the real panel
+        placeholder = self._content_stack.widget(panel_index)
+        is_current = self._content_stack.currentIndex() == panel_index
+        self._content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._content_stack.insertWidget(panel_index, panel)
+        if is_current:
+            self._content_stack.setCurrentWidget(panel)
+
+        self._panels[panel_index] = panel
+        logger.debug("Created panel %s", type(panel).__name__)
+        return panel
 
     def _create_navigation(self) -> None:
-        """Create the navigation tree (simplified)."""
-        # Home
-        home_item = QTreeWidgetItem(["Home"])
-        home_item.setData(0, Qt.UserRole, 0)
-        self._nav_tree.addTopLevelItem(home_item)
-
-        # GPU Information
-        gpu_info = QTreeWidgetItem(["GPU Information"])
-        gpu_info.setData(0, Qt.UserRole, 1)
-        self._nav_tree.addTopLevelItem(gpu_info)
-
-        # Profile Editor
-        editor = QTreeWidgetItem(["Profile Editor"])
-        editor.setData(0, Qt.UserRole, 2)
-        self._nav_tree.addTopLevelItem(editor)
-
-        # Verification Checklist
-        verification = QTreeWidgetItem(["Verification"])
-        verification.setData(0, Qt.UserRole, 3)
-        self._nav_tree.addTopLevelItem(verification)
-
-        # Expand all and select home
-        self._nav_tree.expandAll()
-        self._nav_tree.setCurrentItem(home_item)
+        """Create the navigation list (simplified)."""
+        # Rows map to panels by position in NAV_ITEMS, so no item data is stored
+        items = [QStandardItem(label) for label, _ in self.NAV_ITEMS]
+
+        # Insert all rows in one go
+        model = QStandardItemModel(self._nav_list)
+        model.appendColumn(items)
+        self._nav_list.setModel(model)
+
+        # Select home
+        self._nav_list.setCurrentIndex(model.index(0, 0))
 
     def _create_status_bar(self) -> None:
         """Create the status bar."""
@@ -336,67 +355,136 @@ class MainWindow(QMainWindow):
 
     def _update_status(self, message: str) -> None:
         """Update status bar message."""
-        profile_text = ""
-        if self._current_profile:
-            profile_text = f" | Profile: {self._current_profile.name}"
-        self._status_bar.showMessage(f"{message}{profile_text}")
-
-    def _on_profile_changed(self, profile: Optional[GPUProfile]) -> None:
-        """Handle GPU profile selection change."""
+        self._status_bar.showMessage(message + self._profile_status_suffix)
+
+    def _broadcast_profile(
+        self,
+        profile: Optional[GPUProfile],
+        status: str,
+        source: Optional[QWidget] = None,
+        refresh_selector: bool = False
+    ) -> None:
+        """
+        Make a profile current and notify the panels.
+
+        Args:
+            profile: The new current profile, or None.
+            status: Status bar message to show.
+            source: Panel that originated the change; it is not notified.
+            refresh_selector: Whether to reload the GPU selector dropdown.
+        """
         self._current_profile = profile
         self._config_manager.active_profile = profile
+        self._profile_status_suffix = f" | Profile: {profile.name}" if profile else ""
 
-        # Update all panels
-        self._home_panel.set_profile(profile)
-        self._gpu_info_panel.set_profile(profile)
-        self._profile_editor.set_profile(profile)
-        self._verification_panel.set_profile(profile)
+        # Hidden panels refresh when next shown; unbuilt ones on creation
+        self.profile_changed.emit(profile, source)
 
-        if profile:
-            self._update_status(f"Selected: {profile.name}")
-        else:
-            self._update_status("No profile selected")
+        if refresh_selector:
+            # Re-selecting the profile would re-emit profile_changed and
+            # broadcast the same profile a second time
+            self._gpu_selector.setUpdatesEnabled(False)
+            with QSignalBlocker(self._gpu_selector):
+                self._gpu_selector.refresh_profiles()
+            self._gpu_selector.setUpdatesEnabled(True)
+
+        self._update_status(status)
+
+    def _on_profile_changed(self, profile: Optional[GPUProfile]) -> None:
+        """Handle GPU profile selection change."""
+        # A pending editor update belongs to the previous selection
+        self._profile_update_timer.stop()
+        self._pending_updated_profile = None
+        status = f"Selected: {profile.name}" if profile else "No profile selected"
+        self._broadcast_profile(profile, status)
 
     def _on_profile_updated(self, updated_profile: GPUProfile) -> None:
-        """Handle profile update from editor - refresh all panels with new data."""
-        # Update local reference
-        self._current_profile = updated_profile
-        self._config_manager.active_profile = updated_profile
-
-        # Refresh all panels with updated profile
-        self._home_panel.set_profile(updated_profile)
-        self._gpu_info_panel.set_profile(updated_profile)
-        self._verification_panel.set_profile(updated_profile)
-        # Don't update profile_editor - it triggered this
-
-        # Refresh the GPU selector dropdown to show updated profile
-        self._gpu_selector.refresh_profiles()
+        """Handle profile update from editor; bursts collapse into one refresh."""
+        self._pending_updated_profile = updated_profile
+        self._profile_update_timer.start()
+
+    def _apply_profile_update(self) -> None:
+        """Refresh all panels with the latest profile from the editor."""
+        updated_profile = self._pending_updated_profile
+        self._pending_updated_profile = None
+        if updated_profile is None:
+            return
+
+        self._broadcast_profile(
+            updated_profile,
+            f"Profile updated: {updated_profile.name}",
+            source=self._panels[self.PANEL_PROFILE_EDITOR],
+            refresh_selector=True
+        )
 
-        self._update_status(f"Profile updated: {updated_profile.name}")
+    def _on_nav_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
+        """Handle navigation list selection change."""
+        if current.isValid():
+            # Rows follow NAV_ITEMS, so no QVariant round-trip through the model
+            self._pending_nav_index = self.NAV_ITEMS[current.row()][1]
+            # (Re)start the debounce timer; only the last selection is applied
+            self._nav_timer.start()
 
-    def _on_nav_changed(self, current: QTreeWidgetItem, previous: QTreeWidgetItem) -> None:
-        """Handle navigation tree selection change."""
-        if current:
-            panel_index = current.data(0, Qt.UserRole)
-            if panel_index is not None:
-                self._content_stack.setCurrentIndex(panel_index)
+    def _apply_nav_selection(self) -> None:
+        """Show the panel for the most recent navigation selection."""
+        panel_index = self._pending_nav_index
+        if panel_index is not None:
+            self._content_stack.setCurrentWidget(self._get_panel(panel_index))
 
     def _refresh_profiles(self) -> None:
-        """Refresh GPU profiles."""
-        self._config_manager.load_profiles()
-        self._update_status("Profiles refreshed")
+        """Refresh GPU profiles on a background thread."""
+        if self._profile_thread is not None:
+            return  # Already refreshing
+
+        self._update_status("Refreshing profiles...")
+
+        self._profile_thread = QThread()
+        self._profile_loader = _ProfileLoader(self._config_manager)
+        self._profile_loader.moveToThread(self._profile_thread)
+
+        self._profile_thread.started.connect(self._profile_loader.run)
+        self._profile_loader.finished.connect(self._on_profiles_refreshed)
+        self._profile_loader.finished.connect(self._profile_thread.quit)
+        self._profile_thread.finished.connect(self._on_profile_thread_finished)
+
+        self._profile_thread.start()
+
+    def _on_profiles_refreshed(self, count: int) -> None:
+        """Handle completion of a background profile refresh."""
+        logger.info("Profile refresh loaded %d profiles", count)
+        # Re-selecting the current profile by id broadcasts its reloaded
+        # object through _on_profile_changed
+        self._gpu_selector.setUpdatesEnabled(False)
+        self._gpu_selector.refresh_profiles()
+        self._gpu_selector.setUpdatesEnabled(True)
+        self._update_status(self._refresh_done_status)
+        self._refresh_done_status = "Profiles refreshed"
+
+    def _on_profile_thread_finished(self) -> None:
+        """Release the profile loader thread once it has stopped."""
+        self._profile_loader.deleteLater()
+        self._profile_thread.deleteLater()
+        self._profile_loader = None
+        self._profile_thread = None
+
+    def closeEvent(self, event) -> None:
+        # Don't let the loader thread outlive the window
+        if self._profile_thread is not None:
+            self._profile_thread.quit()
+            self._profile_thread.wait()
+        super().closeEvent(event)
 
     def _on_load_profile(self) -> None:
         """Load a profile from file."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Load GPU Profile",
-            str(self._config_manager.profiles_dir),
+            self._profiles_dir_str,
             "JSON Files (*.json)"
         )
         if file_path:
+            self._refresh_done_status = f"Loaded profile from {file_path}"
             self._refresh_profiles()
-            self._update_status(f"Loaded profile from {file_path}")
 
     def _on_save_profile(self) -> None:
         """Save current profile to file."""
@@ -404,10 +492,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Profile", "No profile selected to save.")
             return
 
+        default_path = os.path.join(self._profiles_dir_str, f"{self._current_profile.id}.json")
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save GPU Profile",
-            str(self._config_manager.profiles_dir / f"{self._current_profile.id}.json"),
+            default_path,
             "JSON Files (*.json)"
         )
         if file_path:
@@ -416,26 +505,65 @@ class MainWindow(QMainWindow):
 
     def _show_wmi_info(self) -> None:
         """Show WMI GPU information."""
-        self._home_panel._on_wmi_clicked()
+        self._get_panel(self.PANEL_HOME)._on_wmi_clicked()
+
+    def _run_task(
+        self,
+        task: Callable[[], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+        status: str
+    ) -> None:
+        """
+        Run a blocking task off the UI thread.
+
+        Args:
+            task: Callable executed on the global QThreadPool.
+            on_finished: Called on the UI thread with the task's result.
+            on_failed: Called on the UI thread with the error message.
+            status: Status bar message shown while the task runs.
+        """
+        worker = _TaskWorker(task)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed)
+        # Keep the worker (and its signals) alive until it reports back
+        self._tasks.add(worker)
+        worker.signals.finished.connect(partial(self._on_task_done, worker))
+        worker.signals.failed.connect(partial(self._on_task_done, worker))
+
+        self._update_status(status)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_task_done(self, worker: _TaskWorker, _outcome: Any) -> None:
+        """Release a finished background task and reset the status bar."""
+        self._tasks.discard(worker)
+        self._update_status("Ready")
 
     def _show_registry_info(self) -> None:
         """Show registry GPU information."""
-        try:
+        def query_registry():
             from src.registry.gpu_registry import get_gpu_registry
+            return get_gpu_registry().get_current_gpu_info()
+
+        self._run_task(
+            query_registry,
+            self._on_registry_info_ready,
+            lambda error: QMessageBox.warning(
+                self, "Error", f"Could not query registry:\n\n{error}"
+            ),
+            "Reading registry..."
+        )
 
-            registry = get_gpu_registry()
-            info = registry.get_current_gpu_info()
-
-            if info:
-                text = "Current GPU from Registry:\n\n"
-                for key, value in info.items():
-                    text += f"{key}: {value}\n"
-            else:
-                text = "No GPU information found in registry."
+    def _on_registry_info_ready(self, info: Optional[Dict[str, Any]]) -> None:
+        """Display the registry query result."""
+        if info:
+            text = "Current GPU from Registry:\n\n"
+            for key, value in info.items():
+                text += f"{key}: {value}\n"
+        else:
+            text = "No GPU information found in registry."
 
-            QMessageBox.information(self, "Registry GPU Info", text)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not query registry:\n\n{str(e)}")
+        QMessageBox.information(self, "Registry GPU Info", text)
 
     def _create_backup(self) -> None:
         """Create a registry backup."""
@@ -451,64 +579,106 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.Yes:
                 backup_manager = get_backup_manager()
-                backups = backup_manager.create_full_gpu_backup()
-
-                if backups:
-                    QMessageBox.information(
-                        self,
-                        "Backup Created",
-                        f"Created {len(backups)} backup file(s) in:\n\n{backup_manager.backup_dir}"
-                    )
-                else:
-                    QMessageBox.warning(self, "Backup Failed", "No backup files were created.")
+                self._run_task(
+                    backup_manager.create_full_gpu_backup,
+                    partial(self._on_backup_done, backup_manager.backup_dir),
+                    self._on_backup_failed,
+                    "Creating registry backup..."
+                )
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Backup failed:\n\n{str(e)}")
+            self._on_backup_failed(str(e))
+
+    def _on_backup_done(self, backup_dir: Path, backups: list) -> None:
+        """Report the result of a background registry backup."""
+        if backups:
+            QMessageBox.information(
+                self,
+                "Backup Created",
+                f"Created {len(backups)} backup file(s) in:\n\n{backup_dir}"
+            )
+        else:
+            QMessageBox.warning(self, "Backup Failed", "No backup files were created.")
+
+    def _on_backup_failed(self, error: str) -> None:
+        """Report a registry backup error."""
+        QMessageBox.critical(self, "Error", f"Backup failed:\n\n{error}")
 
     def _show_about(self) -> None:
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About GPU-SIM",
-            """<h2>GPU-SIM Control Panel</h2>
-            <p>Version 1.0.0</p>
-            <p>Virtual GPU Simulator for Windows</p>
-            <hr>
-            <p>This application allows you to simulate virtual GPU
-            configurations that appear in Windows Task Manager,
-            DxDiag, and system settings.</p>
-            <p><b>⚠️ Warning:</b> Registry modifications can affect
-            system stability. Always create backups first!</p>
-            <hr>
-            <p>© 2024 CodeDeX - GPU-SIM Project</p>
-            """
-        )
+        if self._about_box is None:
+            # Built once; the rich text is only parsed on first open
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About GPU-SIM")
+            self._about_box.setTextFormat(Qt.RichText)
+            self._about_box.setText(
+                """<h2>GPU-SIM Control Panel</h2>
+                <p>Version 1.0.0</p>
+                <p>Virtual GPU Simulator for Windows</p>
+                <hr>
+                <p>This application allows you to simulate virtual GPU
+                configurations that appear in Windows Task Manager,
+                DxDiag, and system settings.</p>
+                <p><b>⚠️ Warning:</b> Registry modifications can affect
+                system stability. Always create backups first!</p>
+                <hr>
+                <p>© 2024 CodeDeX - GPU-SIM Project</p>
+                """
+            )
+            icon = self.windowIcon()
+            if not icon.isNull():
+                self._about_box.setIconPixmap(icon.pixmap(64, 64))
+        self._about_box.exec_()
 
     def _show_docs(self) -> None:
         """Show documentation."""
-        docs_path = project_root / "docs"
-        QMessageBox.information(
-            self,
-            "Documentation",
-            f"Documentation is available in:\n\n{docs_path}\n\n"
-            f"• ARCHITECTURE.md - Project structure\n"
-            f"• REGISTRY_REFERENCE.md - Registry details\n"
-            f"• IDD_ROADMAP.md - Driver development guide"
-        )
+        if self._docs_box is None:
+            self._docs_box = QMessageBox(self)
+            self._docs_box.setIcon(QMessageBox.Information)
+            self._docs_box.setWindowTitle("Documentation")
+            self._docs_box.setTextFormat(Qt.PlainText)
+            self._docs_box.setText(
+                f"Documentation is available in:\n\n{DOCS_DIR}\n\n"
+                f"• ARCHITECTURE.md - Project structure\n"
+                f"• REGISTRY_REFERENCE.md - Registry details\n"
+                f"• IDD_ROADMAP.md - Driver development guide"
+            )
+        self._docs_box.exec_()
 
 
-def main():
-    """Application entry point."""
-    # Configure logging
+def _setup_logging() -> None:
+    """Configure logging unless a caller (e.g. src/main.py) already has."""
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
     )
 
+
+def main():
+    """Application entry point."""
+    _setup_logging()
+
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("GPU-SIM")
     app.setOrganizationName("CodeDeX")
 
+    # Share the window icon with every top-level window and dialog
+    icon = _resolve_window_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
+
+    # Default font is set once here rather than per widget in the stylesheet
+    default_font = QFont(Theme.FONT_FAMILY, 9)
+    default_font.setStyleStrategy(QFont.PreferAntialias)
+    app.setFont(default_font)
+
+    # Apply dark theme once for the whole application; the palette covers
+    # base colors so the stylesheet only needs per-widget overrides
+    app.setPalette(dark_palette())
+    app.setStyleSheet(_load_qss())
+
     # Create and show main window
     window = MainWindow()
     window.show()
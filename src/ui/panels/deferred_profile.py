@@ -0,0 +1,48 @@
+"""
+Deferred Profile Updates
+Mixin that lets hidden content panels postpone profile refreshes until shown.
+"""
+
+from typing import Any, Optional
+
+
+class DeferredProfileMixin:
+    """
+    Mixin for content panels that implement set_profile().
+
+    Connect queue_profile() to a profile broadcast. A visible panel is
+    updated immediately; a hidden one only remembers the latest profile
+    and applies it in its next showEvent. Must be listed before QWidget
+    in the base classes.
+    """
+
+    _profile_dirty = False
+    _pending_profile = None
+
+    def queue_profile(self, profile: Any, source: Optional[Any] = None) -> None:
+        """
+        Schedule a profile update.
+
+        Args:
+            profile: The new GPUProfile, or None.
+            source: The panel that originated the change. It is skipped,
+                since it already shows that profile.
+        """
+        if source is self:
+            return
+
+        if self.isVisible():
+            self._profile_dirty = False
+            self._pending_profile = None
+            self.set_profile(profile)
+        else:
+            self._pending_profile = profile
+            self._profile_dirty = True
+
+    def showEvent(self, event):
+        if self._profile_dirty:
+            profile = self._pending_profile
+            self._profile_dirty = False
+            self._pending_profile = None
+            self.set_profile(profile)
+        super().showEvent(event)
@@ -3,7 +3,7 @@ Display Panel
 Panel for display settings configuration (resolution, refresh rate, rotation).
 """
 
-from typing import Optional
+from typing import List, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QComboBox, QSlider, QPushButton, QCheckBox, QSpinBox
@@ -15,6 +15,30 @@ import sys
 sys.path.insert(0, str(__file__).rsplit('src', 1)[0])
 
 from src.core.gpu_profile import GPUProfile
+from src.ui.panels.profile_cache import ProfileCache
+
+# Shared across panel instances
+_HEADER_FONT = QFont("Segoe UI", 18, QFont.Bold)
+_SUBTITLE_STYLE = "color: #888;"
+_NOTE_STYLE = "color: #666; font-size: 11px;"
+
+# Formatted resolution labels per profile id, keyed to the mode list
+# they were built from so a profile reloaded with new modes is rebuilt
+_mode_labels_cache = ProfileCache()
+
+
+def _mode_labels(profile: GPUProfile) -> List[str]:
+    """Get the resolution combo labels for a profile's display modes."""
+    cached = _mode_labels_cache.get(profile.id, profile.display_modes)
+    if cached is not None:
+        return cached
+
+    labels = [
+        f"{mode.width} x {mode.height} @ {mode.refresh}Hz"
+        for mode in profile.display_modes
+    ]
+    _mode_labels_cache.put(profile.id, profile.display_modes, labels)
+    return labels
 
 
 class DisplayPanel(QWidget):
@@ -36,11 +60,11 @@ class DisplayPanel(QWidget):
 
         # Header
         header = QLabel("Display Settings")
-        header.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        header.setFont(_HEADER_FONT)
         layout.addWidget(header)
 
         subtitle = QLabel("Configure display resolution and refresh rate")
-        subtitle.setStyleSheet("color: #888;")
+        subtitle.setStyleSheet(_SUBTITLE_STYLE)
         layout.addWidget(subtitle)
 
         # Resolution Group
@@ -175,14 +199,7 @@ class DisplayPanel(QWidget):
         btn_layout.addStretch()
 
         self._apply_btn = QPushButton("Apply")
-        self._apply_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #76b900;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-            }
-        """)
+        self._apply_btn.setObjectName("applyBtn")  # Styled by the app theme
         btn_layout.addWidget(self._apply_btn)
 
         layout.addLayout(btn_layout)
@@ -190,7 +207,7 @@ class DisplayPanel(QWidget):
 
         # Note
         note = QLabel("Note: These settings are simulated for demonstration purposes")
-        note.setStyleSheet("color: #666; font-size: 11px;")
+        note.setStyleSheet(_NOTE_STYLE)
         layout.addWidget(note)
 
     def set_profile(self, profile: Optional[GPUProfile]) -> None:
@@ -198,11 +215,16 @@ class DisplayPanel(QWidget):
         self._current_profile = profile
 
         if profile and profile.display_modes:
-            # Update resolution combo with profile's supported modes
-            self._resolution_combo.clear()
-            for mode in profile.display_modes:
-                self._resolution_combo.addItem(
-                    f"{mode.width} x {mode.height} @ {mode.refresh}Hz"
-                )
+            # Update resolution combo with profile's supported modes in one
+            # batch, without per-item signals or repaints
+            combo = self._resolution_combo
+            combo.setUpdatesEnabled(False)
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(_mode_labels(profile))
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+            # Report the new selection once for the whole batch
+            combo.currentIndexChanged.emit(combo.currentIndex())
 
         self.setEnabled(profile is not None)
@@ -3,29 +3,205 @@ GPU Info Panel
 Displays detailed GPU profile information and allows editing.
 """
 
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-    QGridLayout, QTableWidget, QTableWidgetItem, QHeaderView,
-    QPushButton, QTextEdit, QTabWidget, QScrollArea
+    QGridLayout, QTableView, QAbstractItemView, QHeaderView,
+    QPushButton, QTextEdit, QTabWidget, QScrollArea, QStackedWidget
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 
-import sys
-sys.path.insert(0, str(__file__).rsplit('src', 1)[0])
+from ...core.gpu_profile import DisplayMode, GPUProfile
+from .deferred_profile import DeferredProfileMixin
+from .profile_cache import ProfileCache
 
-from src.core.gpu_profile import GPUProfile
+# Shared across panel instances
+_HEADER_FONT = QFont("Segoe UI", 18, QFont.Bold)
+_REGISTRY_TEXT_STYLE = """
+    QTextEdit {
+        background-color: #1e1e1e;
+        color: #d4d4d4;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 12px;
+    }
+"""
+
+# The property column starts at a fixed, user-resizable width and is fitted
+# to its contents once per population, only up to this many rows (fitting
+# costs a sizeHint() per row)
+PROPERTY_COLUMN_WIDTH = 180
+RESIZE_TO_CONTENTS_MAX_ROWS = 500
+
+# Spec table layout: static property labels with a value getter for each
+_SEPARATOR = ("", lambda p: "")
+_SPECS_TEMPLATE: List[Tuple[str, Callable[[GPUProfile], object]]] = [
+    ("Name", lambda p: p.name),
+    ("ID", lambda p: p.id),
+    ("Manufacturer", lambda p: p.manufacturer),
+    _SEPARATOR,
+    ("VRAM", lambda p: f"{p.vram_mb} MB ({p.vram_gb:.1f} GB)"),
+    ("VRAM Type", lambda p: p.vram_type),
+    ("Memory Bus Width", lambda p: f"{p.memory_bus_width} bit"),
+    _SEPARATOR,
+    ("Base Clock", lambda p: f"{p.base_clock_mhz} MHz"),
+    ("Boost Clock", lambda p: f"{p.boost_clock_mhz} MHz"),
+    ("Memory Clock", lambda p: f"{p.memory_clock_mhz} MHz"),
+    _SEPARATOR,
+    ("CUDA Cores", lambda p: str(p.cuda_cores) if p.cuda_cores else "N/A"),
+    ("Stream Processors", lambda p: str(p.stream_processors) if p.stream_processors else "N/A"),
+    ("TDP", lambda p: f"{p.tdp_watts} W"),
+    _SEPARATOR,
+    ("Driver Version", lambda p: p.driver_version),
+    ("Driver Date", lambda p: p.driver_date or "N/A"),
+    ("PCI Device ID", lambda p: p.pci_device_id),
+    ("PCI Vendor ID", lambda p: p.pci_vendor_id),
+    _SEPARATOR,
+    ("Video Processor", lambda p: p.video_processor),
+    ("DAC Type", lambda p: p.dac_type),
+]
+
+# Specification rows per profile id, keyed to the profile object they
+# were built from so an edited (replaced) profile is rebuilt
+_specs_rows_cache = ProfileCache()
+
+
+def _specs_rows(profile: GPUProfile) -> List[Tuple[str, object]]:
+    """Get the (property, value) rows shown in the specifications table."""
+    cached = _specs_rows_cache.get(profile.id, profile)
+    if cached is not None:
+        return cached
+
+    specs = [(label, value(profile)) for label, value in _SPECS_TEMPLATE]
+
+    # Add features
+    if profile.features:
+        specs += [("", ""), ("--- Features ---", "")] + [
+            (key, str(value)) for key, value in profile.features.items()
+        ]
+
+    _specs_rows_cache.put(profile.id, profile, specs)
+    return specs
+
+
+# Registry listing per profile id, keyed to the registry_entries dict
+# it was formatted from
+_registry_listing_cache = ProfileCache()
+
+
+def _registry_listing(profile: GPUProfile) -> str:
+    """Get the text shown in the Registry Entries tab."""
+    cached = _registry_listing_cache.get(profile.id, profile.registry_entries)
+    if cached is not None:
+        return cached
+
+    lines = ["Registry entries that will be applied:", ""]
+    for key, value in profile.registry_entries.items():
+        if isinstance(value, int):
+            lines.append(f'{key} = 0x{value:X} ({value})')
+        else:
+            lines.append(f'{key} = "{value}"')
+    text = "\n".join(lines)
+
+    _registry_listing_cache.put(profile.id, profile.registry_entries, text)
+    return text
+
+
+class SpecsModel(QAbstractTableModel):
+    """Two-column table model over (property, value) spec rows."""
+
+    HEADERS = ("Property", "Value")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, object]] = []
+
+    def set_rows(self, rows: List[Tuple[str, object]]) -> None:
+        """Replace the model contents in a single reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return str(self._rows[index.row()][index.column()])
+
+
+class ModesModel(QAbstractTableModel):
+    """Table model that formats a profile's display modes on demand."""
+
+    HEADERS = ("Width", "Height", "Refresh Rate")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._modes: List[DisplayMode] = []
+
+    def set_modes(self, modes: List[DisplayMode]) -> None:
+        """Replace the model contents in a single reset."""
+        self.beginResetModel()
+        self._modes = modes
+        self.endResetModel()
 
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._modes)
 
-class GPUInfoPanel(QWidget):
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        mode = self._modes[index.row()]
+        column = index.column()
+        if column == 0:
+            return str(mode.width)
+        if column == 1:
+            return str(mode.height)
+        return f"{mode.refresh} Hz"
+
+
+class GPUInfoPanel(DeferredProfileMixin, QWidget):
     """
     Panel showing detailed GPU profile information.
+
+    Each tab is only populated while it is the current tab; the Registry
+    Entries and Display Modes tabs are also built on first activation.
     """
 
+    # Quiet period after a refresh in which further profile switches (e.g.
+    # arrowing through the selector) are coalesced into one trailing refresh
+    SET_PROFILE_DEBOUNCE_MS = 50
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._current_profile: Optional[GPUProfile] = None
+        self._next_profile: Optional[GPUProfile] = None
+        self._profile_timer = QTimer(self)
+        self._profile_timer.setSingleShot(True)
+        self._profile_timer.setInterval(self.SET_PROFILE_DEBOUNCE_MS)
+        self._profile_timer.timeout.connect(self._on_profile_timer)
+        self._profile_refresh_pending = False
+        self._registry_text: Optional[QTextEdit] = None
+        self._modes_model: Optional[ModesModel] = None
+        self._modes_table: Optional[QTableView] = None
+        self._tab_dirty = {"specs": True, "registry": True, "modes": True}
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -35,137 +211,153 @@ class GPUInfoPanel(QWidget):
 
         # Header
         header = QLabel("GPU Profile Details")
-        header.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        header.setFont(_HEADER_FONT)
         layout.addWidget(header)
 
         # Tab widget for organization
-        tabs = QTabWidget()
+        self._tabs = QTabWidget()
 
         # Specifications tab
-        specs_tab = QWidget()
-        specs_layout = QVBoxLayout(specs_tab)
+        self._specs_tab = QWidget()
+        specs_layout = QVBoxLayout(self._specs_tab)
 
-        self._specs_table = QTableWidget()
-        self._specs_table.setColumnCount(2)
-        self._specs_table.setHorizontalHeaderLabels(["Property", "Value"])
+        self._specs_model = SpecsModel(self)
+        self._specs_table = QTableView()
+        self._specs_table.setModel(self._specs_model)
         self._specs_table.horizontalHeader().setStretchLastSection(True)
-        self._specs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self._specs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        self._specs_table.setColumnWidth(0, PROPERTY_COLUMN_WIDTH)
         self._specs_table.setAlternatingRowColors(True)
-        self._specs_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._specs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         specs_layout.addWidget(self._specs_table)
 
-        tabs.addTab(specs_tab, "Specifications")
+        self._tabs.addTab(self._specs_tab, "Specifications")
 
-        # Registry Entries tab
-        registry_tab = QWidget()
-        registry_layout = QVBoxLayout(registry_tab)
-
-        self._registry_text = QTextEdit()
-        self._registry_text.setReadOnly(True)
-        self._registry_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
-        registry_layout.addWidget(self._registry_text)
-
-        tabs.addTab(registry_tab, "Registry Entries")
-
-        # Display Modes tab
-        modes_tab = QWidget()
-        modes_layout = QVBoxLayout(modes_tab)
-
-        self._modes_table = QTableWidget()
-        self._modes_table.setColumnCount(3)
-        self._modes_table.setHorizontalHeaderLabels(["Width", "Height", "Refresh Rate"])
-        self._modes_table.horizontalHeader().setStretchLastSection(True)
-        self._modes_table.setAlternatingRowColors(True)
-        self._modes_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        modes_layout.addWidget(self._modes_table)
+        # Registry Entries and Display Modes tabs start as empty placeholders
+        self._registry_tab = QWidget()
+        QVBoxLayout(self._registry_tab)
+        self._tabs.addTab(self._registry_tab, "Registry Entries")
 
-        tabs.addTab(modes_tab, "Display Modes")
+        self._modes_tab = QWidget()
+        QVBoxLayout(self._modes_tab)
+        self._tabs.addTab(self._modes_tab, "Display Modes")
 
-        layout.addWidget(tabs)
+        self._tabs.currentChanged.connect(self._on_tab_changed)
 
         # No profile message
         self._no_profile_label = QLabel("Select a GPU profile to view details")
         self._no_profile_label.setAlignment(Qt.AlignCenter)
         self._no_profile_label.setStyleSheet("color: #888; font-size: 14px;")
-        layout.addWidget(self._no_profile_label)
+
+        # Only the current page takes part in layout
+        self._stack = QStackedWidget()
+        self._stack.addWidget(self._tabs)
+        self._stack.addWidget(self._no_profile_label)
+        layout.addWidget(self._stack)
 
         self._show_no_profile(True)
 
+    def _build_registry_tab(self) -> None:
+        """Create the registry text view inside its placeholder tab."""
+        self._registry_text = QTextEdit()
+        self._registry_text.setReadOnly(True)
+        self._registry_text.setStyleSheet(_REGISTRY_TEXT_STYLE)
+        self._registry_tab.layout().addWidget(self._registry_text)
+
+    def _build_modes_tab(self) -> None:
+        """Create the display modes table inside its placeholder tab."""
+        self._modes_model = ModesModel(self)
+        self._modes_table = QTableView()
+        self._modes_table.setModel(self._modes_model)
+        self._modes_table.horizontalHeader().setStretchLastSection(True)
+        self._modes_table.setAlternatingRowColors(True)
+        self._modes_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._modes_tab.layout().addWidget(self._modes_table)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Build and refresh a lazy tab when it becomes current."""
+        widget = self._tabs.widget(index)
+
+        if widget is self._specs_tab:
+            if self._tab_dirty["specs"]:
+                self._populate_specs()
+                self._tab_dirty["specs"] = False
+        elif widget is self._registry_tab:
+            if self._registry_text is None:
+                self._build_registry_tab()
+            if self._tab_dirty["registry"]:
+                self._populate_registry()
+                self._tab_dirty["registry"] = False
+        elif widget is self._modes_tab:
+            if self._modes_table is None:
+                self._build_modes_tab()
+            if self._tab_dirty["modes"]:
+                self._populate_modes()
+                self._tab_dirty["modes"] = False
+
     def _show_no_profile(self, show: bool) -> None:
         """Toggle between profile view and no-profile message."""
-        self._no_profile_label.setVisible(show)
+        self._stack.setCurrentWidget(self._no_profile_label if show else self._tabs)
 
     def set_profile(self, profile: Optional[GPUProfile]) -> None:
-        """Update panel with a new profile."""
+        """
+        Update panel with a new profile.
+
+        The first call (e.g. on first build or show) refreshes immediately;
+        calls within SET_PROFILE_DEBOUNCE_MS of it refresh once switching settles.
+        """
+        self._next_profile = profile
+        if self._profile_timer.isActive():
+            self._profile_refresh_pending = True
+        else:
+            self._apply_profile()
+        self._profile_timer.start()
+
+    def _on_profile_timer(self) -> None:
+        """Apply the profile set during the quiet period, if any."""
+        if self._profile_refresh_pending:
+            self._profile_refresh_pending = False
+            self._apply_profile()
+
+    def _apply_profile(self) -> None:
+        """Show the most recently set profile."""
+        profile = self._next_profile
+
+        # Reselecting the profile already shown has nothing to refresh
+        if profile is not None and profile is self._current_profile:
+            return
+
         self._current_profile = profile
+        self._show_no_profile(not profile)
+
+        # Only the current tab is filled now; the others on activation
+        for name in self._tab_dirty:
+            self._tab_dirty[name] = True
+        self._on_tab_changed(self._tabs.currentIndex())
+
+    def _populate_specs(self) -> None:
+        """Fill the specifications table from the current profile."""
+        profile = self._current_profile
+        if not profile:
+            self._specs_model.set_rows([])
+            return
 
+        specs = _specs_rows(profile)
+        self._specs_model.set_rows(specs)
+        if len(specs) <= RESIZE_TO_CONTENTS_MAX_ROWS:
+            self._specs_table.resizeColumnToContents(0)
+
+    def _populate_registry(self) -> None:
+        """Fill the registry entries view from the current profile."""
+        profile = self._current_profile
         if not profile:
-            self._show_no_profile(True)
-            self._specs_table.setRowCount(0)
             self._registry_text.clear()
-            self._modes_table.setRowCount(0)
             return
 
-        self._show_no_profile(False)
-
-        # Update specifications table
-        specs = [
-            ("Name", profile.name),
-            ("ID", profile.id),
-            ("Manufacturer", profile.manufacturer),
-            ("", ""),
-            ("VRAM", f"{profile.vram_mb} MB ({profile.vram_gb:.1f} GB)"),
-            ("VRAM Type", profile.vram_type),
-            ("Memory Bus Width", f"{profile.memory_bus_width} bit"),
-            ("", ""),
-            ("Base Clock", f"{profile.base_clock_mhz} MHz"),
-            ("Boost Clock", f"{profile.boost_clock_mhz} MHz"),
-            ("Memory Clock", f"{profile.memory_clock_mhz} MHz"),
-            ("", ""),
-            ("CUDA Cores", str(profile.cuda_cores) if profile.cuda_cores else "N/A"),
-            ("Stream Processors", str(profile.stream_processors) if profile.stream_processors else "N/A"),
-            ("TDP", f"{profile.tdp_watts} W"),
-            ("", ""),
-            ("Driver Version", profile.driver_version),
-            ("Driver Date", profile.driver_date or "N/A"),
-            ("PCI Device ID", profile.pci_device_id),
-            ("PCI Vendor ID", profile.pci_vendor_id),
-            ("", ""),
-            ("Video Processor", profile.video_processor),
-            ("DAC Type", profile.dac_type),
-        ]
+        # Plain text: values may contain '<' or '&' and must not be parsed as HTML
+        self._registry_text.setPlainText(_registry_listing(profile))
 
-        # Add features
-        if profile.features:
-            specs.append(("", ""))
-            specs.append(("--- Features ---", ""))
-            for key, value in profile.features.items():
-                specs.append((key, str(value)))
-
-        self._specs_table.setRowCount(len(specs))
-        for row, (prop, value) in enumerate(specs):
-            self._specs_table.setItem(row, 0, QTableWidgetItem(prop))
-            self._specs_table.setItem(row, 1, QTableWidgetItem(str(value)))
-
-        # Update registry entries
-        registry_text = "Registry entries that will be applied:\n\n"
-        for key, value in profile.registry_entries.items():
-            if isinstance(value, int):
-                registry_text += f'{key} = 0x{value:X} ({value})\n'
-            else:
-                registry_text += f'{key} = "{value}"\n'
-        self._registry_text.setText(registry_text)
-
-        # Update display modes
-        self._modes_table.setRowCount(len(profile.display_modes))
-        for row, mode in enumerate(profile.display_modes):
-            self._modes_table.setItem(row, 0, QTableWidgetItem(str(mode.width)))
-            self._modes_table.setItem(row, 1, QTableWidgetItem(str(mode.height)))
-            self._modes_table.setItem(row, 2, QTableWidgetItem(f"{mode.refresh} Hz"))
+    def _populate_modes(self) -> None:
+        """Fill the display modes table from the current profile."""
+        profile = self._current_profile
+        self._modes_model.set_modes(profile.display_modes if profile else [])
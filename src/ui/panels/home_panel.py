@@ -3,19 +3,157 @@ Home Panel
 The main dashboard panel showing current GPU configuration.
 """
 
-from typing import Optional
+import os
+import ctypes
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QGroupBox, QGridLayout, QPushButton, QMessageBox, QCheckBox
 )
 from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QFileSystemWatcher, pyqtSlot
+
+from ...core.gpu_profile import GPUProfile
+from ..theme import Theme
+from .deferred_profile import DeferredProfileMixin
+from .profile_cache import ProfileCache
+
+# Shared across panel instances
+_HEADER_FONT = QFont(Theme.FONT_FAMILY, Theme.FONT_HEADER_SIZE, QFont.Bold)
+_GPU_NAME_FONT = QFont("Segoe UI", 18, QFont.Bold)
+_STATCARD_VALUE_FONT = QFont(Theme.FONT_FAMILY, 16, QFont.Bold)
+_HEADER_STYLE = f"color: {Theme.COLOR_ACCENT};"
+_SUBTITLE_STYLE = f"color: {Theme.COLOR_TEXT_SECONDARY}; font-size: {Theme.FONT_BODY_SIZE}px;"
+_ADMIN_FOOTER_STYLE = f"color: {Theme.COLOR_ACCENT}; font-size: {Theme.FONT_SMALL_SIZE}px;"
+_RESTRICTED_FOOTER_STYLE = f"color: {Theme.COLOR_DANGER}; font-size: {Theme.FONT_SMALL_SIZE}px;"
+_STATCARD_STYLE = f"""
+    StatCard {{
+        background-color: {Theme.COLOR_SURFACE};
+        border-radius: 8px;
+        border: 1px solid {Theme.COLOR_BORDER};
+    }}
+"""
+_STATCARD_TITLE_STYLE = f"color: {Theme.COLOR_TEXT_SECONDARY}; font-size: {Theme.FONT_SMALL_SIZE}px;"
+_STATCARD_VALUE_STYLE = f"color: {Theme.COLOR_ACCENT};"
+_BYPASS_CHECKBOX_STYLE = f"""
+    QCheckBox {{
+        color: {Theme.COLOR_TEXT_SECONDARY};
+        font-size: 12px;
+    }}
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border: 2px solid {Theme.COLOR_BORDER};
+        border-radius: 3px;
+        background-color: {Theme.COLOR_SURFACE};
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {Theme.COLOR_ACCENT};
+        border-color: {Theme.COLOR_ACCENT};
+    }}
+"""
+# Feature labels switch look through their featureState property, so the
+# rules are parsed once on the group instead of per label and update
+_FEATURES_GROUP_STYLE = f"""
+    QLabel {{
+        color: #666;
+    }}
+    QLabel[featureState="on"] {{
+        color: {Theme.COLOR_ACCENT};
+        font-weight: bold;
+    }}
+    QLabel[featureState="off"] {{
+        color: {Theme.COLOR_TEXT_SECONDARY};
+        text-decoration: line-through;
+    }}
+"""
+
+# Feature label -> profile.features flags, any of which enables it
+_FEATURE_KEYS = {
+    "Ray Tracing": ("ray_tracing",),
+    "DLSS/FSR": ("dlss", "fsr"),
+    "CUDA/OpenCL": ("cuda",),
+    "NVENC/VCE": ("nvenc", "vce"),
+}
+
+# featureState per feature label for each profile id, keyed to the
+# profile object it was computed from so an edited profile is redone
+_feature_states_cache = ProfileCache()
+
+
+def _feature_states(profile: GPUProfile) -> Dict[str, str]:
+    """Get the "on"/"off" featureState of every feature label for a profile."""
+    cached = _feature_states_cache.get(profile.id, profile)
+    if cached is not None:
+        return cached
+
+    features = profile.features
+    states = {}
+    for feature_name, keys in _FEATURE_KEYS.items():
+        enabled = any(features.get(key, False) for key in keys)
+        if not enabled and feature_name == "CUDA/OpenCL":
+            enabled = profile.cuda_cores > 0
+        states[feature_name] = "on" if enabled else "off"
+
+    _feature_states_cache.put(profile.id, profile, states)
+    return states
+
+
+# Elevation cannot change during the life of the process, so ask once
+try:
+    _IS_ADMIN = bool(ctypes.windll.shell32.IsUserAnAdmin())
+except Exception:
+    _IS_ADMIN = False
+
+# GPU-Z bypass DLL as built from injector/fakenvapi
+BYPASS_DLL_SOURCE = (
+    Path(__file__).parent.parent.parent.parent
+    / "injector" / "fakenvapi" / "build" / "src" / "nvapi64.dll"
+)
+
+# Windows-only subsystems, imported and created on first use
+_registry = None
+_wmi_monitor = None
+_nvidia_installer = None
+_installer_wizard_class = None
+
+
+def _get_registry():
+    """Get the GPU registry manager, importing it on first call."""
+    global _registry
+    if _registry is None:
+        from ...registry.gpu_registry import get_gpu_registry
+        _registry = get_gpu_registry()
+    return _registry
 
-import sys
-sys.path.insert(0, str(__file__).rsplit('src', 1)[0])
 
-from src.core.gpu_profile import GPUProfile
-from src.ui.theme import Theme
+def _get_wmi_monitor():
+    """Get the WMI monitor, importing it on first call."""
+    global _wmi_monitor
+    if _wmi_monitor is None:
+        from ...wmi.wmi_monitor import get_wmi_monitor
+        _wmi_monitor = get_wmi_monitor()
+    return _wmi_monitor
+
+
+def _get_nvidia_installer():
+    """Get the nvidia_panel.installer module, importing it on first call."""
+    global _nvidia_installer
+    if _nvidia_installer is None:
+        from nvidia_panel import installer
+        _nvidia_installer = installer
+    return _nvidia_installer
+
+
+def _get_installer_wizard_class():
+    """Get the InstallerWizard class, importing it on first call."""
+    global _installer_wizard_class
+    if _installer_wizard_class is None:
+        from ..installer_wizard import InstallerWizard
+        _installer_wizard_class = InstallerWizard
+    return _installer_wizard_class
 
 
 class StatCard(QFrame):
@@ -24,24 +162,18 @@ class StatCard(QFrame):
     def __init__(self, title: str, value: str, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
-        self.setStyleSheet(f"""
-            StatCard {{
-                background-color: {Theme.COLOR_SURFACE};
-                border-radius: 8px;
-                border: 1px solid {Theme.COLOR_BORDER};
-            }}
-        """)
+        self.setStyleSheet(_STATCARD_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 10, 15, 10)
 
         self._title_label = QLabel(title)
-        self._title_label.setStyleSheet(f"color: {Theme.COLOR_TEXT_SECONDARY}; font-size: {Theme.FONT_SMALL_SIZE}px;")
+        self._title_label.setStyleSheet(_STATCARD_TITLE_STYLE)
         layout.addWidget(self._title_label)
 
         self._value_label = QLabel(value)
-        self._value_label.setFont(QFont(Theme.FONT_FAMILY, 16, QFont.Bold))
-        self._value_label.setStyleSheet(f"color: {Theme.COLOR_ACCENT};")
+        self._value_label.setFont(_STATCARD_VALUE_FONT)
+        self._value_label.setStyleSheet(_STATCARD_VALUE_STYLE)
         layout.addWidget(self._value_label)
 
     def set_value(self, value: str) -> None:
@@ -51,14 +183,33 @@ class StatCard(QFrame):
         self._title_label.setText(title)
 
 
-class HomePanel(QWidget):
+class HomePanel(DeferredProfileMixin, QWidget):
     """
     Main dashboard panel showing virtual GPU information.
     """
 
+    # Quiet period after a display refresh in which further profile switches
+    # (e.g. arrowing through the selector) are coalesced into one trailing
+    # refresh; the action buttons always use the latest profile
+    SET_PROFILE_DEBOUNCE_MS = 50
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._current_profile: Optional[GPUProfile] = None
+        self._profile_timer = QTimer(self)
+        self._profile_timer.setSingleShot(True)
+        self._profile_timer.setInterval(self.SET_PROFILE_DEBOUNCE_MS)
+        self._profile_timer.timeout.connect(self._on_profile_timer)
+        self._profile_refresh_pending = False
+
+        # One reusable message box per icon, created on first use
+        self._message_boxes: Dict[QMessageBox.Icon, QMessageBox] = {}
+
+        # Whether BYPASS_DLL_SOURCE exists, dropped when its folder changes
+        self._dll_exists: Optional[bool] = None
+        self._dll_watcher = QFileSystemWatcher(self)
+        self._dll_watcher.directoryChanged.connect(self._on_dll_dir_changed)
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -69,12 +220,12 @@ class HomePanel(QWidget):
 
         # Header
         header = QLabel("GPU-SIM Control Panel")
-        header.setFont(QFont(Theme.FONT_FAMILY, Theme.FONT_HEADER_SIZE, QFont.Bold))
-        header.setStyleSheet(f"color: {Theme.COLOR_ACCENT};")
+        header.setFont(_HEADER_FONT)
+        header.setStyleSheet(_HEADER_STYLE)
         layout.addWidget(header)
 
         subtitle = QLabel("Virtual GPU Simulator for Windows")
-        subtitle.setStyleSheet(f"color: {Theme.COLOR_TEXT_SECONDARY}; font-size: {Theme.FONT_BODY_SIZE}px;")
+        subtitle.setStyleSheet(_SUBTITLE_STYLE)
         layout.addWidget(subtitle)
 
         layout.addSpacing(10)
@@ -84,7 +235,7 @@ class HomePanel(QWidget):
         gpu_layout = QVBoxLayout(gpu_group)
 
         self._gpu_name_label = QLabel("No GPU Selected")
-        self._gpu_name_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self._gpu_name_label.setFont(_GPU_NAME_FONT)
         gpu_layout.addWidget(self._gpu_name_label)
 
         self._gpu_manufacturer_label = QLabel("")
@@ -112,13 +263,12 @@ class HomePanel(QWidget):
 
         # Features Section
         features_group = QGroupBox("Features")
+        features_group.setStyleSheet(_FEATURES_GROUP_STYLE)
         features_layout = QGridLayout(features_group)
 
         self._feature_labels = {}
-        features = ["Ray Tracing", "DLSS/FSR", "CUDA/OpenCL", "NVENC/VCE"]
-        for i, feature in enumerate(features):
+        for i, feature in enumerate(_FEATURE_KEYS):
             label = QLabel(f"❌ {feature}")
-            label.setStyleSheet("color: #666;")
             self._feature_labels[feature] = label
             features_layout.addWidget(label, i // 2, i % 2)
 
@@ -128,19 +278,6 @@ class HomePanel(QWidget):
         actions_layout = QHBoxLayout()
 
         self._apply_btn = QPushButton("⚡ Apply to System")
-        self._apply_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #76b900;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                font-size: 14px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #8bc34a;
-            }
-        """)
         self._apply_btn.setEnabled(False)
         self._apply_btn.setStyleSheet(Theme.STYLE_BUTTON_PRIMARY)
         self._apply_btn.clicked.connect(self._on_apply_clicked)
@@ -180,23 +317,7 @@ class HomePanel(QWidget):
         # GPU-Z Bypass toggle
         bypass_layout = QHBoxLayout()
         self._gpuz_bypass_checkbox = QCheckBox("Enable GPU-Z Bypass")
-        self._gpuz_bypass_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Theme.COLOR_TEXT_SECONDARY};
-                font-size: 12px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {Theme.COLOR_BORDER};
-                border-radius: 3px;
-                background-color: {Theme.COLOR_SURFACE};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {Theme.COLOR_ACCENT};
-                border-color: {Theme.COLOR_ACCENT};
-            }}
-        """)
+        self._gpuz_bypass_checkbox.setStyleSheet(_BYPASS_CHECKBOX_STYLE)
         self._gpuz_bypass_checkbox.setToolTip(
             "When enabled, copies nvapi64.dll to intercept GPU-Z/HWiNFO queries.\n"
             "Requires building the DLL from injector/fakenvapi/"
@@ -209,23 +330,38 @@ class HomePanel(QWidget):
         layout.addStretch()
 
         # Footer - show admin status
-        import ctypes
-        try:
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-        except Exception:
-            is_admin = False
-
-        if is_admin:
+        if _IS_ADMIN:
             footer = QLabel("Admin Mode Active - Full Functionality")
-            footer.setStyleSheet(f"color: {Theme.COLOR_ACCENT}; font-size: {Theme.FONT_SMALL_SIZE}px;")
+            footer.setStyleSheet(_ADMIN_FOOTER_STYLE)
         else:
             footer = QLabel("Restricted Mode - Run as Administrator Required")
-            footer.setStyleSheet(f"color: {Theme.COLOR_DANGER}; font-size: {Theme.FONT_SMALL_SIZE}px;")
+            footer.setStyleSheet(_RESTRICTED_FOOTER_STYLE)
         layout.addWidget(footer)
 
     def set_profile(self, profile: Optional[GPUProfile]) -> None:
-        """Update the panel with a new profile."""
+        """
+        Set the current profile and refresh the display.
+
+        The first call (e.g. on first build or show) refreshes immediately;
+        calls within SET_PROFILE_DEBOUNCE_MS of it refresh once switching settles.
+        """
         self._current_profile = profile
+        if self._profile_timer.isActive():
+            self._profile_refresh_pending = True
+        else:
+            self._apply_profile()
+        self._profile_timer.start()
+
+    @pyqtSlot()
+    def _on_profile_timer(self) -> None:
+        """Refresh for the profile set during the quiet period, if any."""
+        if self._profile_refresh_pending:
+            self._profile_refresh_pending = False
+            self._apply_profile()
+
+    def _apply_profile(self) -> None:
+        """Show the current profile."""
+        profile = self._current_profile
 
         if profile:
             self._gpu_name_label.setText(profile.name)
@@ -242,25 +378,10 @@ class HomePanel(QWidget):
             self._driver_card.set_value(profile.driver_version)
 
             # Update features
-            features = profile.features
+            states = _feature_states(profile)
             for feature_name, label in self._feature_labels.items():
-                # Check various feature flags
-                enabled = False
-                if "Ray Tracing" in feature_name:
-                    enabled = features.get("ray_tracing", False)
-                elif "DLSS" in feature_name:
-                    enabled = features.get("dlss", False) or features.get("fsr", False)
-                elif "CUDA" in feature_name:
-                    enabled = features.get("cuda", False) or profile.cuda_cores > 0
-                elif "NVENC" in feature_name:
-                    enabled = features.get("nvenc", False) or features.get("vce", False)
-
-                if enabled:
-                    label.setText(f"{feature_name}")
-                    label.setStyleSheet(f"color: {Theme.COLOR_ACCENT}; font-weight: bold;")
-                else:
-                    label.setText(f"{feature_name}")
-                    label.setStyleSheet(f"color: {Theme.COLOR_TEXT_SECONDARY}; text-decoration: line-through;")
+                label.setText(feature_name)
+                self._set_feature_state(label, states[feature_name])
 
             self._apply_btn.setEnabled(True)
             self._vdd_btn.setEnabled(True)
@@ -273,18 +394,55 @@ class HomePanel(QWidget):
             self._driver_card.set_value("--")
 
             for label in self._feature_labels.values():
-                label.setStyleSheet(f"color: {Theme.COLOR_TEXT_SECONDARY};")
+                self._set_feature_state(label, "")
 
             self._apply_btn.setEnabled(False)
             self._vdd_btn.setEnabled(False)
 
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButtons = QMessageBox.Ok,
+        default: QMessageBox.StandardButton = QMessageBox.NoButton
+    ) -> int:
+        """
+        Show a modal message, reusing the box cached for its icon.
+
+        Returns:
+            The StandardButton that was clicked.
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            box.setTextFormat(Qt.PlainText)
+            self._message_boxes[icon] = box
+
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(default)
+        return box.exec_()
+
+    @staticmethod
+    def _set_feature_state(label: QLabel, state: str) -> None:
+        """Restyle a feature label by switching its featureState property."""
+        if label.property("featureState") == state:
+            return
+        label.setProperty("featureState", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    @pyqtSlot()
     def _on_apply_clicked(self) -> None:
         """Handle apply button click."""
         if not self._current_profile:
             return
 
-        reply = QMessageBox.warning(
-            self,
+        reply = self._show_message(
+            QMessageBox.Warning,
             "Apply GPU Profile",
             f"This will modify Windows registry to simulate:\n\n"
             f"{self._current_profile.name}\n\n"
@@ -297,38 +455,37 @@ class HomePanel(QWidget):
 
         if reply == QMessageBox.Yes:
             try:
-                from src.registry.gpu_registry import get_gpu_registry
-                registry = get_gpu_registry()
-                success = registry.apply_gpu_profile(self._current_profile)
+                success = _get_registry().apply_gpu_profile(self._current_profile)
 
                 if success:
-                    QMessageBox.information(
-                        self,
+                    self._show_message(
+                        QMessageBox.Information,
                         "Success",
                         "GPU profile applied!\n\n"
                         "Restart your computer for changes to take effect."
                     )
                 else:
-                    QMessageBox.critical(
-                        self,
+                    self._show_message(
+                        QMessageBox.Critical,
                         "Error",
                         "Failed to apply GPU profile.\n\n"
                         "Make sure you're running as Administrator."
                     )
             except Exception as e:
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Critical,
                     "Error",
                     f"Error applying profile:\n\n{str(e)}"
                 )
 
+    @pyqtSlot()
     def _on_vdd_install_clicked(self) -> None:
         """Handle VDD install button - one-click driver installation."""
         if not self._current_profile:
             return
 
-        reply = QMessageBox.warning(
-            self,
+        reply = self._show_message(
+            QMessageBox.Warning,
             "Install Virtual Display Driver",
             f"This will install a Virtual Display Driver that shows:\n\n"
             f"GPU: {self._current_profile.name}\n"
@@ -343,19 +500,19 @@ class HomePanel(QWidget):
 
         if reply == QMessageBox.Yes:
             try:
-                from src.vdd.vdd_installer import VDDInstaller, is_admin, is_test_signing_enabled
+                from ...vdd.vdd_installer import VDDInstaller, is_admin, is_test_signing_enabled
 
                 if not is_admin():
-                    QMessageBox.critical(
-                        self,
+                    self._show_message(
+                        QMessageBox.Critical,
                         "Administrator Required",
                         "Please run GPU-SIM as Administrator to install the driver."
                     )
                     return
 
                 if not is_test_signing_enabled():
-                    reply = QMessageBox.question(
-                        self,
+                    reply = self._show_message(
+                        QMessageBox.Question,
                         "Test Signing Required",
                         "Test signing mode is not enabled.\n\n"
                         "Would you like to enable it now?\n"
@@ -363,18 +520,18 @@ class HomePanel(QWidget):
                         QMessageBox.Yes | QMessageBox.No
                     )
                     if reply == QMessageBox.Yes:
-                        from src.vdd.vdd_installer import enable_test_signing
+                        from ...vdd.vdd_installer import enable_test_signing
                         if enable_test_signing():
-                            QMessageBox.information(
-                                self,
+                            self._show_message(
+                                QMessageBox.Information,
                                 "Test Signing Enabled",
                                 "Test signing has been enabled.\n\n"
                                 "Please restart your computer, then run GPU-SIM again "
                                 "to complete the VDD installation."
                             )
                         else:
-                            QMessageBox.critical(
-                                self,
+                            self._show_message(
+                                QMessageBox.Critical,
                                 "Error",
                                 "Failed to enable test signing mode."
                             )
@@ -389,8 +546,8 @@ class HomePanel(QWidget):
                     manufacturer=self._current_profile.manufacturer
                 )
 
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "Installing...",
                     "Installing Virtual Display Driver...\n\n"
                     "This may take a moment. Click OK to proceed."
@@ -399,8 +556,8 @@ class HomePanel(QWidget):
                 success = installer.full_install(vram_mb=vram_mb)
 
                 if success:
-                    QMessageBox.information(
-                        self,
+                    self._show_message(
+                        QMessageBox.Information,
                         "Installation Complete",
                         f"Virtual Display Driver installed successfully!\n\n"
                         f"GPU: {self._current_profile.name}\n"
@@ -409,31 +566,29 @@ class HomePanel(QWidget):
                         f"Check DxDiag → Display 2 to see the result."
                     )
                 else:
-                    QMessageBox.critical(
-                        self,
+                    self._show_message(
+                        QMessageBox.Critical,
                         "Installation Failed",
                         "Failed to install Virtual Display Driver.\n\n"
                         "Check the console output for details."
                     )
 
             except Exception as e:
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Critical,
                     "Error",
                     f"Error installing VDD:\n\n{str(e)}"
                 )
 
+    @pyqtSlot()
     def _on_wmi_clicked(self) -> None:
         """Handle WMI info button click."""
         try:
-            from src.wmi.wmi_monitor import get_wmi_monitor
-
-            monitor = get_wmi_monitor()
-            controllers = monitor.get_video_controllers()
+            controllers = _get_wmi_monitor().get_video_controllers()
 
             if not controllers:
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "WMI GPU Info",
                     "No video controllers found via WMI."
                 )
@@ -446,28 +601,26 @@ class HomePanel(QWidget):
                 info_text += f"  Driver: {ctrl.driver_version}\n"
                 info_text += f"  Status: {ctrl.status}\n\n"
 
-            QMessageBox.information(self, "WMI GPU Info", info_text)
+            self._show_message(QMessageBox.Information, "WMI GPU Info", info_text)
 
         except Exception as e:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "WMI Error",
                 f"Could not query WMI:\n\n{str(e)}\n\n"
                 f"Make sure WMI module is installed:\npip install WMI"
             )
 
+    @pyqtSlot()
     def _on_nvidia_panel_clicked(self) -> None:
         """Install the NVIDIA Control Panel as a system app."""
         try:
-            from nvidia_panel.installer import (
-                install_nvidia_control_panel, is_installed, is_admin
-            )
-            from pathlib import Path
+            installer = _get_nvidia_installer()
 
             # Check if already installed
-            if is_installed():
-                reply = QMessageBox.question(
-                    self,
+            if installer.is_installed():
+                reply = self._show_message(
+                    QMessageBox.Question,
                     "NVIDIA Control Panel",
                     "NVIDIA Control Panel is already installed!\n\n"
                     "Would you like to reinstall it?",
@@ -478,9 +631,9 @@ class HomePanel(QWidget):
                     return
 
             # Check admin privileges
-            if not is_admin():
-                QMessageBox.warning(
-                    self,
+            if not installer.is_admin():
+                self._show_message(
+                    QMessageBox.Warning,
                     "Administrator Required",
                     "Installing NVIDIA Control Panel requires Administrator privileges.\n\n"
                     "Please restart GPU-SIM as Administrator."
@@ -491,52 +644,66 @@ class HomePanel(QWidget):
             source_dir = Path(__file__).parent.parent.parent / "nvidia_panel"
 
             # Perform installation
-            success, message = install_nvidia_control_panel(source_dir)
+            success, message = installer.install_nvidia_control_panel(source_dir)
 
             if success:
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "Installation Complete",
                     message
                 )
             else:
-                QMessageBox.critical(
-                    self,
+                self._show_message(
+                    QMessageBox.Critical,
                     "Installation Failed",
                     message
                 )
 
         except Exception as e:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "Error",
                 f"Could not install NVIDIA Control Panel:\n\n{str(e)}"
             )
 
+    @pyqtSlot()
     def _on_wizard_clicked(self) -> None:
         """Open the installation wizard."""
         try:
-            from src.ui.installer_wizard import InstallerWizard
-
-            wizard = InstallerWizard(profile=self._current_profile, parent=self)
+            wizard = _get_installer_wizard_class()(profile=self._current_profile, parent=self)
             wizard.exec_()
 
         except Exception as e:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "Error",
                 f"Could not open installation wizard:\n\n{str(e)}"
             )
 
+    def _bypass_dll_exists(self) -> bool:
+        """Check for the bypass DLL, caching the answer while its folder is watched."""
+        if self._dll_exists is not None:
+            return self._dll_exists
+
+        exists = BYPASS_DLL_SOURCE.exists()
+        folder = str(BYPASS_DLL_SOURCE.parent)
+        # Without a watch on the folder (e.g. not built yet) a cached
+        # answer could go stale, so only cache once the watch is in place
+        if folder in self._dll_watcher.directories() or (
+            BYPASS_DLL_SOURCE.parent.is_dir() and self._dll_watcher.addPath(folder)
+        ):
+            self._dll_exists = exists
+        return exists
+
+    @pyqtSlot(str)
+    def _on_dll_dir_changed(self, path: str) -> None:
+        """Forget the cached bypass DLL check after its folder changes."""
+        self._dll_exists = None
+
+    @pyqtSlot(bool)
     def _on_gpuz_bypass_toggled(self, checked: bool) -> None:
         """Handle GPU-Z bypass toggle - auto-copies nvapi64.dll to known app folders."""
-        from pathlib import Path
-        import shutil
-        import os
-
-        # Path to the built DLL
-        project_root = Path(__file__).parent.parent.parent.parent
-        dll_source = project_root / "injector" / "fakenvapi" / "build" / "src" / "nvapi64.dll"
+        dll_source = BYPASS_DLL_SOURCE
 
         # Common installation paths for GPU monitoring tools
         target_folders = [
@@ -549,9 +716,9 @@ class HomePanel(QWidget):
         ]
 
         if checked:
-            if not dll_source.exists():
-                QMessageBox.warning(
-                    self,
+            if not self._bypass_dll_exists():
+                self._show_message(
+                    QMessageBox.Warning,
                     "DLL Not Found",
                     "GPU-Z bypass DLL not found!\n\n"
                     f"Expected location:\n{dll_source}\n\n"
@@ -575,8 +742,8 @@ class HomePanel(QWidget):
                         pass
 
             if copied_to:
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "GPU-Z Bypass Enabled",
                     f"nvapi64.dll copied to {len(copied_to)} location(s):\n\n" +
                     "\n".join(f"• {p}" for p in copied_to) +
@@ -584,8 +751,8 @@ class HomePanel(QWidget):
                 )
             else:
                 # No folders found, show manual copy instructions
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "GPU-Z Bypass Enabled",
                     "GPU-Z/HWiNFO not found in default locations.\n\n"
                     "Manually copy nvapi64.dll to your GPU-Z folder:\n"
@@ -604,15 +771,15 @@ class HomePanel(QWidget):
                         pass
 
             if removed_from:
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "GPU-Z Bypass Disabled",
                     f"nvapi64.dll removed from {len(removed_from)} location(s).\n\n"
                     "Restart GPU-Z/HWiNFO to see original GPU info."
                 )
             else:
-                QMessageBox.information(
-                    self,
+                self._show_message(
+                    QMessageBox.Information,
                     "GPU-Z Bypass Disabled",
                     "GPU-Z bypass has been disabled."
                 )
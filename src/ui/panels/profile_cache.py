@@ -0,0 +1,51 @@
+"""
+Profile Cache
+Bounded per-profile cache for values derived from a GPU profile.
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class ProfileCache:
+    """
+    Least-recently-used cache of derived values keyed by profile id.
+
+    Each value is stored with the source object it was built from (the
+    profile or one of its fields) and is only returned for that same
+    object, so an edited or reloaded profile is rebuilt. Only the most
+    recent MAX_ENTRIES profiles are kept, so old profiles can be freed.
+    """
+
+    MAX_ENTRIES = 16
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+
+    def get(self, profile_id: str, source: Any) -> Optional[Any]:
+        """
+        Get the value cached for a profile.
+
+        Args:
+            profile_id: The profile identifier.
+            source: The object the value must have been built from.
+
+        Returns:
+            The cached value, or None if missing or built from another object.
+        """
+        entry = self._entries.get(profile_id)
+        if entry is None or entry[0] is not source:
+            return None
+        self._entries.move_to_end(profile_id)
+        return entry[1]
+
+    def put(self, profile_id: str, source: Any, value: Any) -> None:
+        """Cache a value built from source, evicting the least recently used profile."""
+        self._entries[profile_id] = (source, value)
+        self._entries.move_to_end(profile_id)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -18,9 +18,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.core.gpu_profile import GPUProfile
 from src.core.config_manager import get_config_manager
+from src.ui.panels.deferred_profile import DeferredProfileMixin
 
 
-class ProfileEditorPanel(QWidget):
+class ProfileEditorPanel(DeferredProfileMixin, QWidget):
     """
     Panel for editing GPU profile specifications.
     Allows customization of VRAM, clocks, and other settings.
@@ -16,6 +16,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
+from src.ui.panels.deferred_profile import DeferredProfileMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,7 +140,7 @@ class VerificationStep(QFrame):
                 raise FileNotFoundError("GeForce Experience not found")
 
 
-class VerificationPanel(QWidget):
+class VerificationPanel(DeferredProfileMixin, QWidget):
     """Panel showing verification steps with clickable launchers."""
 
     def __init__(self, parent: Optional[QWidget] = None):
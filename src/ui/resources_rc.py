@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\xb7\
+\x51\
+\x57\x69\x7a\x61\x72\x64\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\
+\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\
+\x31\x65\x31\x65\x31\x65\x3b\x0a\x7d\x0a\x51\x57\x69\x7a\x61\x72\
+\x64\x50\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x31\
+\x65\x31\x65\x31\x65\x3b\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x66\x66\x66\x66\x66\x66\x3b\x0a\x7d\x0a\x51\x4c\x61\
+\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\
+\x20\x23\x66\x66\x66\x66\x66\x66\x3b\x0a\x7d\x0a\x51\x47\x72\x6f\
+\x75\x70\x42\x6f\x78\x20\x7b\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x23\x37\x36\x62\x39\x30\x30\x3b\x0a\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x33\x61\x33\x61\x33\x61\x3b\x0a\x20\x20\x20\x20\x62\
+\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x35\x70\
+\x78\x3b\x0a\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\
+\x70\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\x64\
+\x64\x69\x6e\x67\x2d\x74\x6f\x70\x3a\x20\x31\x30\x70\x78\x3b\x0a\
+\x7d\x0a\x51\x47\x72\x6f\x75\x70\x42\x6f\x78\x3a\x3a\x74\x69\x74\
+\x6c\x65\x20\x7b\x0a\x20\x20\x20\x20\x73\x75\x62\x63\x6f\x6e\x74\
+\x72\x6f\x6c\x2d\x6f\x72\x69\x67\x69\x6e\x3a\x20\x6d\x61\x72\x67\
+\x69\x6e\x3b\x0a\x20\x20\x20\x20\x6c\x65\x66\x74\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\
+\x20\x30\x20\x35\x70\x78\x3b\x0a\x7d\x0a\x51\x43\x6f\x6d\x62\x6f\
+\x42\x6f\x78\x2c\x20\x51\x53\x70\x69\x6e\x42\x6f\x78\x20\x7b\x0a\
+\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\
+\x6f\x6c\x6f\x72\x3a\x20\x23\x32\x64\x32\x64\x32\x64\x3b\x0a\x20\
+\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x66\x66\x66\x66\x66\
+\x66\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\
+\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x33\x61\x33\x61\x33\x61\
+\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\
+\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\
+\x64\x64\x69\x6e\x67\x3a\x20\x35\x70\x78\x3b\x0a\x7d\x0a\x51\x43\
+\x6f\x6d\x62\x6f\x42\x6f\x78\x3a\x68\x6f\x76\x65\x72\x2c\x20\x51\
+\x53\x70\x69\x6e\x42\x6f\x78\x3a\x68\x6f\x76\x65\x72\x20\x7b\x0a\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\
+\x73\x6f\x6c\x69\x64\x20\x23\x37\x36\x62\x39\x30\x30\x3b\x0a\x7d\
+\x0a\x51\x43\x68\x65\x63\x6b\x42\x6f\x78\x20\x7b\x0a\x20\x20\x20\
+\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x66\x66\x66\x66\x66\x66\x3b\
+\x0a\x7d\x0a\x51\x43\x68\x65\x63\x6b\x42\x6f\x78\x3a\x3a\x69\x6e\
+\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0a\x20\x20\x20\x20\x77\x69\
+\x64\x74\x68\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x68\
+\x65\x69\x67\x68\x74\x3a\x20\x31\x38\x70\x78\x3b\x0a\x7d\x0a\x51\
+\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x23\x37\x36\x62\x39\x30\x30\x3b\x0a\x20\x20\x20\x20\
+\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x30\x30\x30\x30\x30\x30\x3b\x0a\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\
+\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\
+\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\
+\x64\x64\x69\x6e\x67\x3a\x20\x38\x70\x78\x20\x31\x36\x70\x78\x3b\
+\x0a\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\
+\x3a\x20\x62\x6f\x6c\x64\x3b\x0a\x7d\x0a\x51\x50\x75\x73\x68\x42\
+\x75\x74\x74\x6f\x6e\x3a\x68\x6f\x76\x65\x72\x20\x7b\x0a\x20\x20\
+\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x38\x62\x63\x33\x34\x61\x3b\x0a\x7d\x0a\x51\
+\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x70\x72\x65\x73\x73\
+\x65\x64\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x35\x61\x38\x66\
+\x30\x30\x3b\x0a\x7d\x0a\x51\x50\x72\x6f\x67\x72\x65\x73\x73\x42\
+\x61\x72\x20\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\
+\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x33\x61\x33\x61\
+\x33\x61\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\
+\x61\x64\x69\x75\x73\x3a\x20\x33\x70\x78\x3b\x0a\x20\x20\x20\x20\
+\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x20\x63\x65\x6e\x74\
+\x65\x72\x3b\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\
+\x66\x66\x66\x66\x66\x66\x3b\x0a\x7d\x0a\x51\x50\x72\x6f\x67\x72\
+\x65\x73\x73\x42\x61\x72\x3a\x3a\x63\x68\x75\x6e\x6b\x20\x7b\x0a\
+\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\
+\x6f\x6c\x6f\x72\x3a\x20\x23\x37\x36\x62\x39\x30\x30\x3b\x0a\x7d\
+\x0a\x51\x50\x6c\x61\x69\x6e\x54\x65\x78\x74\x45\x64\x69\x74\x20\
+\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x30\x64\x30\x64\x30\x64\x3b\
+\x0a\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x66\x66\x66\
+\x66\x66\x66\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\
+\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x33\x61\x33\x61\
+\x33\x61\x3b\x0a\x7d\x0a\
+\x00\x00\x02\x20\
+\x00\
+\x00\x07\xed\x78\x9c\xad\x55\x4d\x6f\xdb\x30\x0c\xbd\xe7\x57\x08\
+\xc8\xd9\x80\xd3\xac\x5d\xaa\xdc\xd2\xc3\x76\x58\x81\x15\x2d\xd6\
+\xb3\x6c\x29\x36\x51\x45\x12\x24\xb9\x4e\x3b\xf4\xbf\x97\x76\xac\
+\xd9\x89\x3f\x9a\x16\x93\x2e\x86\x4c\x3e\xf2\x3d\x91\xd4\xdd\x2d\
+\x03\xf5\x08\x8a\xeb\x92\xfc\x9d\x11\x5c\x09\x4b\x9f\x32\xab\x0b\
+\xc5\xa3\x54\x4b\x6d\x29\x99\x2f\x44\xb5\xd7\xb3\xb7\xd9\xdd\x23\
+\xf0\x4c\xf8\x71\xd3\x0b\x5e\xed\x75\xfd\x3b\x9c\x6d\xeb\x75\x38\
+\xdb\x6a\xe5\x23\x07\xaf\x82\x92\xc5\x37\xb3\xaf\x31\x7f\x81\xf3\
+\x7f\x40\x94\x73\xc5\x9e\xab\xef\x80\xae\x2d\x17\xe8\xaf\xb4\x12\
+\x83\x76\x94\x82\x17\xbb\xc6\xda\x30\xce\x41\x65\x94\xac\x2a\xd4\
+\xd6\x3f\xb2\x8c\x43\xe1\x28\x19\x8b\x76\x40\xa1\xb9\x7e\x16\x76\
+\x9c\xd7\x92\x57\x7b\x0a\xc0\x09\x29\x52\x2f\xf8\x38\xc6\xf7\xab\
+\xe4\x3a\x8e\x8f\xb4\x29\x73\xf4\xad\x51\x7f\xa0\xad\xd9\xe8\x7d\
+\xe3\x5e\xeb\x54\x0a\xc8\x72\x4f\x91\x89\xe4\xeb\x23\x4d\x16\x66\
+\x4f\x9c\x96\xc0\xdb\xcc\x06\x28\x5f\x06\x29\x76\xcc\x66\xa0\x22\
+\xaf\x0d\xba\xc6\xe1\xb4\x91\xac\x7b\xdc\x49\x84\x52\x0f\x5e\x8a\
+\x26\x1f\x57\x24\x29\xa6\x64\xb5\x8c\xb4\x05\x04\xa3\x0d\xe8\x01\
+\x4a\x8a\xad\x1f\x80\xa6\x24\x6e\x93\x38\x95\x01\x63\xdd\xe8\x5d\
+\xa2\x5b\xd2\x13\xa5\xf7\x79\xf2\xcb\x5e\x2e\xad\x1c\xa8\x45\x09\
+\xdc\xe7\x88\x75\x19\x78\x87\x5c\x28\xe5\x56\x9b\x08\x1b\x42\x8d\
+\x15\xe2\xef\xc2\xe5\x9b\xc2\x7b\x7d\x6a\x31\x92\x59\xb7\x36\xc9\
+\xe2\x6a\xa4\x40\x97\x4d\x22\x2d\xfa\xb9\x45\xd9\x01\x1b\x10\xb9\
+\x83\x67\xac\x70\x6e\xaa\x44\x3b\x9d\xde\x71\xe3\xe0\x58\x22\xff\
+\xf9\x05\xe3\x55\xbd\x4e\x8c\xe7\xcc\x18\xf9\xb2\xf1\xea\x2b\x7d\
+\xd0\x57\xbb\x27\xdf\x45\xb8\xaf\x5b\xa1\x8a\x0d\x9b\x50\xa7\x5f\
+\x3a\x51\xa2\x31\xc5\xdd\xe0\x3d\xb5\x88\x9f\xee\xe7\xc6\xf5\xe3\
+\x5a\x68\x0c\xbf\x12\xe0\xde\x33\x5f\xb8\x49\xbe\x93\xe3\xe5\xa1\
+\xba\xc0\x6a\x6a\x9d\xa7\x57\x66\x81\x4b\x50\x62\x68\xfe\xfd\x14\
+\x0c\x09\x56\x58\x14\x39\xa4\x1e\xf4\xc4\x5d\x77\xdf\x83\x7e\x23\
+\xf6\x3a\xeb\x26\x17\xe9\x53\x3b\x10\x9c\x61\x69\x3b\xd4\x2b\x19\
+\x50\x4f\x74\xa0\x18\x05\x5b\x03\xfb\xc3\xc2\x2b\x8e\x25\x26\xcf\
+\xa3\x95\x37\x03\xf5\xa3\x37\x22\x84\xc9\x99\xe2\xf2\xbc\x30\x5d\
+\xf5\xc3\x6c\x59\x1d\xcf\x5f\x4a\x22\x64\x4e\xe2\xc1\xd0\xd7\x21\
+\xb4\x01\xf5\xbf\x26\xe2\xb1\xe0\x6f\xb3\x77\xa7\x30\x74\x17\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\xae\xc3\xc3\
+\x00\x74\
+\x00\x68\x00\x65\x00\x6d\x00\x65\x00\x73\
+\x00\x0f\
+\x09\x9f\x6b\xa3\
+\x00\x77\
+\x00\x69\x00\x7a\x00\x61\x00\x72\x00\x64\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x0d\
+\x0f\x8e\xd2\x23\
+\x00\x6d\
+\x00\x61\x00\x69\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x71\x00\x73\x00\x73\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x36\x00\x01\x00\x00\x00\x01\x00\x00\x04\xbb\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x45\x7e\xca\x8e\
+\x00\x00\x00\x36\x00\x01\x00\x00\x00\x01\x00\x00\x04\xbb\
+\x00\x00\x01\xa1\x45\x81\x07\x6a\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -3,7 +3,52 @@ GPU-SIM UI Theme Definitions
 Defines the color palette, fonts, and stylesheets for the professional dark theme.
 """
 
-from PyQt5.QtGui import QColor, QFont
+import logging
+
+from PyQt5.QtCore import QFile, QIODevice
+from PyQt5.QtGui import QColor, QFont, QPalette
+
+logger = logging.getLogger(__name__)
+
+
+def load_qss(path: str) -> str:
+    """
+    Read a stylesheet from a Qt resource (":/...") or filesystem path.
+
+    Returns:
+        The stylesheet text, or "" if it could not be read.
+    """
+    qss_file = QFile(path)
+    if not qss_file.open(QIODevice.ReadOnly | QIODevice.Text):
+        logger.warning(f"Could not open stylesheet: {path}")
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
+
+
+def dark_palette() -> QPalette:
+    """
+    Build an application palette matching the dark theme colors.
+
+    Lets widgets the stylesheet doesn't cover (and the first paint before
+    styles are polished) use the theme colors without extra QSS rules.
+    """
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(Theme.COLOR_BACKGROUND))
+    palette.setColor(QPalette.WindowText, QColor(Theme.COLOR_TEXT_PRIMARY))
+    palette.setColor(QPalette.Base, QColor(Theme.COLOR_BACKGROUND))
+    palette.setColor(QPalette.AlternateBase, QColor(Theme.COLOR_SURFACE))
+    palette.setColor(QPalette.Text, QColor(Theme.COLOR_TEXT_PRIMARY))
+    palette.setColor(QPalette.Button, QColor(Theme.COLOR_SURFACE))
+    palette.setColor(QPalette.ButtonText, QColor(Theme.COLOR_TEXT_PRIMARY))
+    palette.setColor(QPalette.Highlight, QColor(Theme.COLOR_ACCENT))
+    palette.setColor(QPalette.HighlightedText, QColor("white"))
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, QColor(Theme.COLOR_TEXT_SECONDARY))
+    return palette
+
 
 class Theme:
     # Color Palette
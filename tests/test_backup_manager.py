@@ -0,0 +1,71 @@
+"""
+Unit tests for BackupManager.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.registry.backup_manager import BackupManager
+
+
+@pytest.fixture
+def mixed_backups(tmp_path):
+    """Backup dir with interleaved .reg and .hiv backups, oldest first."""
+    names = [
+        "gpu_Video_20240101_000000.reg",
+        "gpu_Video_20240101_000000.hiv",
+        "gpu_Video_20240102_000000.reg",
+        "gpu_Video_20240102_000000.hiv",
+        "gpu_Video_20240103_000000.reg",
+        "gpu_Video_20240103_000000.hiv",
+        "notes.txt",
+    ]
+    for mtime, name in enumerate(names, start=1):
+        path = tmp_path / name
+        path.write_text("")
+        os.utime(path, (mtime, mtime))
+    return tmp_path
+
+
+class TestBackupManager:
+    """Tests for BackupManager with mixed text and binary backups."""
+
+    def test_list_backups_includes_hives(self, mixed_backups):
+        manager = BackupManager(backup_dir=str(mixed_backups))
+        names = [p.name for p in manager.list_backups()]
+
+        assert names == [
+            "gpu_Video_20240103_000000.hiv",
+            "gpu_Video_20240103_000000.reg",
+            "gpu_Video_20240102_000000.hiv",
+            "gpu_Video_20240102_000000.reg",
+            "gpu_Video_20240101_000000.hiv",
+            "gpu_Video_20240101_000000.reg",
+        ]
+
+    def test_cleanup_keeps_count_per_kind(self, mixed_backups):
+        manager = BackupManager(backup_dir=str(mixed_backups))
+
+        assert manager.cleanup_old_backups(keep_count=2) == 2
+        remaining = sorted(p.name for p in manager.list_backups())
+        assert remaining == [
+            "gpu_Video_20240102_000000.hiv",
+            "gpu_Video_20240102_000000.reg",
+            "gpu_Video_20240103_000000.hiv",
+            "gpu_Video_20240103_000000.reg",
+        ]
+        assert (mixed_backups / "notes.txt").exists()
+
+    def test_restore_dispatches_hive(self, mixed_backups):
+        manager = BackupManager(backup_dir=str(mixed_backups))
+        latest = manager.get_latest_backup()
+        assert latest.suffix == ".hiv"
+
+        with patch.object(manager, "restore_backup_binary", return_value=True) as restore:
+            assert manager.restore_backup(latest)
+        restore.assert_called_once_with(BackupManager.GPU_REGISTRY_PATHS[0], latest)
@@ -96,6 +96,21 @@ class TestGPUProfile:
         )
         assert amd.compute_units == 4608
 
+    def test_profile_display_info(self):
+        profile = GPUProfile(
+            id="nvidia",
+            name="Test",
+            manufacturer="NVIDIA",
+            driver_version="546.65",
+            vram_mb=4096,
+            vram_type="GDDR5",
+            cuda_cores=2880
+        )
+        assert profile.display_info() == "🎮 2880 CUDA Cores | 📺 4 GB GDDR5 | 🔧 Driver 546.65"
+
+        profile.vram_mb = 8192
+        assert "📺 8 GB GDDR5" in profile.display_info()
+
     def test_profile_to_dict(self):
         profile = GPUProfile(
             id="test",
@@ -198,6 +213,23 @@ class TestConfigManager:
         assert len(profiles) == 1
         assert profiles[0].id == "test_profile"
 
+    def test_list_profiles_cache_invalidation(self, temp_profiles_dir):
+        manager = ConfigManager(profiles_dir=str(temp_profiles_dir))
+        manager.load_profiles()
+
+        assert manager.list_profiles() is manager.list_profiles()
+
+        manager.save_profile(GPUProfile(
+            id="cached_profile",
+            name="Cached GPU",
+            manufacturer="Test",
+            driver_version="1.0"
+        ))
+        assert {p.id for p in manager.list_profiles()} == {"test_profile", "cached_profile"}
+
+        manager.delete_profile("test_profile")
+        assert [p.id for p in manager.list_profiles()] == ["cached_profile"]
+
     def test_active_profile(self, temp_profiles_dir):
         manager = ConfigManager(profiles_dir=str(temp_profiles_dir))
         manager.load_profiles()